@@ -41,7 +41,7 @@ from scheduler_telescope import (
 )
 
 from scheduler_astropy import (
-    julian_date, lst, galactic_coordinates, ecliptic_coordinates,
+    julian_date, lst, galactic_coordinates_batch, ecliptic_coordinates_batch,
     rise_set_times, moon_position, moon_separation, twilight_times,
     altitude_azimuth, airmass
 )
@@ -798,7 +798,7 @@ class Scheduler:
                 tel_field = TelescopeField(
                     field_number=self.fields[self.i_prev].field_number,
                     n_done=self.fields[self.i_prev].n_done,
-                    filename="".join(self.fields[self.i_prev].filenames[:self.fields[self.i_prev].n_done])
+                    filenames=self.fields[self.i_prev].filenames[:self.fields[self.i_prev].n_done]
                 )
                 
                 result = focus_telescope(tel_field, self.telescope_status, self.focus_default)
@@ -836,7 +836,7 @@ class Scheduler:
                 tel_field = TelescopeField(
                     field_number=self.fields[self.i_prev].field_number,
                     n_done=self.fields[self.i_prev].n_done,
-                    filename=self.fields[self.i_prev].filenames[self.fields[self.i_prev].n_done - 1]
+                    filenames=self.fields[self.i_prev].filenames[:self.fields[self.i_prev].n_done]
                 )
                 
                 if get_telescope_offsets(tel_field, self.telescope_status) != 0:
@@ -854,21 +854,27 @@ class Scheduler:
         """Initialize field rise/set times and observability"""
         num_observable = 0
         
-        for field_obj in self.fields:
+        # Convert the whole catalog to galactic/ecliptic coordinates at once
+        if self.fields:
+            ra = [field_obj.ra for field_obj in self.fields]
+            dec = [field_obj.dec for field_obj in self.fields]
+            gal_long, gal_lat = galactic_coordinates_batch(ra, dec)
+            epoch, ecl_long, ecl_lat = ecliptic_coordinates_batch(ra, dec, jd)
+        
+        for i, field_obj in enumerate(self.fields):
             # Initialize observation tracking
             field_obj.n_done = 0
             field_obj.status = FieldStatus.NOT_DOABLE
             field_obj.selection_code = SelectionCode.NOT_SELECTED
             
-            # Calculate galactic coordinates
-            field_obj.gal_long, field_obj.gal_lat = galactic_coordinates(
-                field_obj.ra, field_obj.dec
-            )
+            # Galactic coordinates
+            field_obj.gal_long = float(gal_long[i])
+            field_obj.gal_lat = float(gal_lat[i])
             
-            # Calculate ecliptic coordinates
-            field_obj.epoch, field_obj.ecl_long, field_obj.ecl_lat = ecliptic_coordinates(
-                field_obj.ra, field_obj.dec, jd
-            )
+            # Ecliptic coordinates
+            field_obj.epoch = epoch
+            field_obj.ecl_long = float(ecl_long[i])
+            field_obj.ecl_lat = float(ecl_lat[i])
             
             # Special handling for darks and flats
             if field_obj.shutter == ShutterCode.DARK:
@@ -12,6 +12,7 @@ This module provides astronomical calculations including:
 import math
 import numpy as np
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Tuple, Optional
 from dataclasses import dataclass
 import logging
@@ -29,12 +30,28 @@ HOURS_TO_RAD = math.pi / 12.0
 RAD_TO_HOURS = 12.0 / math.pi
 SIDEREAL_DAY_IN_HOURS = 23.93446972
 JD_EPOCH_2000 = 2451545.0  # JD for 2000-01-01 12:00 UT
+SOLAR_TO_SIDEREAL = 365.25 / 366.25  # Solar hours per sidereal hour
+
+
+@dataclass(frozen=True)
+class ObserverTrig:
+    """Observer latitude trig terms, computed once per site"""
+    sin_lat: float
+    cos_lat: float
+    tan_lat: float
+    
+    @classmethod
+    def from_latitude(cls, latitude: float) -> 'ObserverTrig':
+        """Build from observer latitude in degrees"""
+        lat_rad = latitude * DEG_TO_RAD
+        return cls(math.sin(lat_rad), math.cos(lat_rad), math.tan(lat_rad))
 
 
 # ============================================================================
 # Time Conversion Functions
 # ============================================================================
 
+@lru_cache(maxsize=4096)
 def julian_date(year: int, month: int, day: int, 
                 hour: float = 0.0, minute: float = 0.0, second: float = 0.0) -> float:
     """
@@ -71,6 +88,7 @@ def julian_date(year: int, month: int, day: int,
     return jd
 
 
+@lru_cache(maxsize=4096)
 def jd_to_datetime(jd: float) -> datetime:
     """
     Convert Julian Date to datetime object.
@@ -133,10 +151,7 @@ def gmst(jd: float) -> float:
     gmst_hours = gmst0 + ut_hours * 1.00273790935
     
     # Normalize to 0-24 hours
-    while gmst_hours >= 24.0:
-        gmst_hours -= 24.0
-    while gmst_hours < 0.0:
-        gmst_hours += 24.0
+    gmst_hours %= 24.0
     
     return gmst_hours
 
@@ -156,14 +171,35 @@ def lst(jd: float, longitude: float) -> float:
     lst_hours = gmst_hours - longitude
     
     # Normalize to 0-24 hours
-    while lst_hours >= 24.0:
-        lst_hours -= 24.0
-    while lst_hours < 0.0:
-        lst_hours += 24.0
+    lst_hours %= 24.0
     
     return lst_hours
 
 
+def lst_batch(jd, longitude: float) -> np.ndarray:
+    """
+    Calculate Local Sidereal Time for an array of Julian Dates.
+    
+    Same formula as gmst()/lst(), evaluated once over the whole array.
+    
+    Args:
+        jd: Julian Date(s)
+        longitude: Observatory longitude in hours (west positive)
+    
+    Returns:
+        Array of LST in hours (0-24)
+    """
+    jd = np.asarray(jd, dtype=float)
+    t = (jd - JD_EPOCH_2000) / 36525.0
+    gmst0 = (6.697374558 + 
+             2400.051336 * t + 
+             0.000025862 * t * t)
+    ut_hours = (jd - np.floor(jd - 0.5) - 0.5) * 24.0
+    gmst_hours = (gmst0 + ut_hours * 1.00273790935) % 24.0
+    
+    return (gmst_hours - longitude) % 24.0
+
+
 def ut_to_jd(ut_hours: float, jd_start: float) -> float:
     """
     Convert UT hours to Julian Date.
@@ -232,10 +268,47 @@ def precess_coordinates(ra: float, dec: float, jd_from: float, jd_to: float) ->
     dec_new = dec_new * RAD_TO_DEG
     
     # Normalize RA to 0-24 hours
-    while ra_new < 0:
-        ra_new += 24.0
-    while ra_new >= 24.0:
-        ra_new -= 24.0
+    ra_new %= 24.0
+    
+    return ra_new, dec_new
+
+
+def precess_coordinates_batch(ra, dec, jd_from: float, jd_to: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Precess arrays of coordinates from one epoch to another.
+    
+    Vectorized form of precess_coordinates() with the same Meeus angles.
+    
+    Args:
+        ra: Right ascensions in hours
+        dec: Declinations in degrees
+        jd_from: Julian Date of initial epoch
+        jd_to: Julian Date of target epoch
+    
+    Returns:
+        Tuple of (ra, dec) arrays at target epoch
+    """
+    ra_rad = np.asarray(ra, dtype=float) * HOURS_TO_RAD
+    dec_rad = np.asarray(dec, dtype=float) * DEG_TO_RAD
+    
+    # Precession angles depend only on the epochs, so are computed once
+    t0 = (jd_from - JD_EPOCH_2000) / 36525.0
+    t = (jd_to - jd_from) / 36525.0
+    zeta = ((2306.2181 + 1.39656 * t0) * t + 0.30188 * t * t) * DEG_TO_RAD / 3600.0
+    theta = ((2004.3109 - 0.85330 * t0) * t - 0.42665 * t * t) * DEG_TO_RAD / 3600.0
+    cos_theta = math.cos(theta)
+    sin_theta = math.sin(theta)
+    
+    cos_dec = np.cos(dec_rad)
+    sin_dec = np.sin(dec_rad)
+    cos_ra = np.cos(ra_rad)
+    
+    a = cos_dec * np.sin(ra_rad)
+    b = cos_theta * cos_dec * cos_ra - sin_theta * sin_dec
+    c = sin_theta * cos_dec * cos_ra + cos_theta * sin_dec
+    
+    ra_new = ((np.arctan2(a, b) + zeta) * RAD_TO_HOURS) % 24.0
+    dec_new = np.arcsin(c) * RAD_TO_DEG
     
     return ra_new, dec_new
 
@@ -281,14 +354,54 @@ def galactic_coordinates(ra: float, dec: float, epoch: float = 2000.0) -> Tuple[
     b = math.asin(math.sin(dec_rad) * math.sin(dec_gp) + 
                   math.cos(dec_rad) * math.cos(dec_gp) * math.cos(ra_rad - ra_gp)) * RAD_TO_DEG
     
-    while l < 0:
-        l += 360.0
-    while l >= 360.0:
-        l -= 360.0
+    l %= 360.0
     
     return l, b
 
 
+def galactic_coordinates_batch(ra, dec, epoch: float = 2000.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert arrays of equatorial coordinates to galactic coordinates.
+    
+    Vectorized form of galactic_coordinates().
+    
+    Args:
+        ra: Right ascensions in hours
+        dec: Declinations in degrees
+        epoch: Epoch of coordinates (default J2000)
+    
+    Returns:
+        Tuple of (l, b) arrays in degrees
+    """
+    # Convert to J2000 if necessary
+    if abs(epoch - 2000.0) > 0.01:
+        jd_epoch = JD_EPOCH_2000 + (epoch - 2000.0) * 365.25
+        ra, dec = precess_coordinates_batch(ra, dec, jd_epoch, JD_EPOCH_2000)
+    
+    ra_rad = np.asarray(ra, dtype=float) * HOURS_TO_RAD
+    dec_rad = np.asarray(dec, dtype=float) * DEG_TO_RAD
+    
+    # Galactic pole and center (J2000)
+    ra_gp = 12.8605 * HOURS_TO_RAD
+    sin_dec_gp = math.sin(27.1282 * DEG_TO_RAD)
+    cos_dec_gp = math.cos(27.1282 * DEG_TO_RAD)
+    l_ncp = 122.932 * DEG_TO_RAD
+    
+    sin_dec = np.sin(dec_rad)
+    cos_dec = np.cos(dec_rad)
+    d_ra = ra_rad - ra_gp
+    
+    # Same construction as galactic_coordinates()
+    b_rad = np.arcsin(cos_dec * cos_dec_gp * np.cos(d_ra) + sin_dec * sin_dec_gp)
+    cos_b = np.cos(b_rad)
+    sin_l = cos_dec * np.sin(d_ra) / cos_b
+    cos_l = (sin_dec - np.sin(b_rad) * sin_dec_gp) / (cos_b * cos_dec_gp)
+    
+    l = ((np.arctan2(sin_l, cos_l) + l_ncp) * RAD_TO_DEG) % 360.0
+    
+    return l, b_rad * RAD_TO_DEG
+
+
 def ecliptic_coordinates(ra: float, dec: float, jd: float) -> Tuple[float, float, float]:
     """
     Convert equatorial to ecliptic coordinates.
@@ -324,10 +437,7 @@ def ecliptic_coordinates(ra: float, dec: float, jd: float) -> Tuple[float, float
     lat = lat * RAD_TO_DEG
     
     # Normalize longitude to 0-360
-    while lon < 0:
-        lon += 360.0
-    while lon >= 360.0:
-        lon -= 360.0
+    lon %= 360.0
     
     # Calculate epoch (year)
     epoch = 2000.0 + (jd - JD_EPOCH_2000) / 365.25
@@ -335,6 +445,38 @@ def ecliptic_coordinates(ra: float, dec: float, jd: float) -> Tuple[float, float
     return epoch, lon, lat
 
 
+def ecliptic_coordinates_batch(ra, dec, jd: float) -> Tuple[float, np.ndarray, np.ndarray]:
+    """
+    Convert arrays of equatorial coordinates to ecliptic coordinates.
+    
+    Vectorized form of ecliptic_coordinates().
+    
+    Args:
+        ra: Right ascensions in hours
+        dec: Declinations in degrees
+        jd: Julian Date for obliquity calculation
+    
+    Returns:
+        Tuple of (epoch, longitude, latitude) with longitude/latitude arrays in degrees
+    """
+    # Mean obliquity of the ecliptic
+    t = (jd - JD_EPOCH_2000) / 36525.0
+    eps_rad = (23.439291 - 0.0130042 * t) * DEG_TO_RAD
+    sin_eps = math.sin(eps_rad)
+    cos_eps = math.cos(eps_rad)
+    
+    ra_rad = np.asarray(ra, dtype=float) * HOURS_TO_RAD
+    dec_rad = np.asarray(dec, dtype=float) * DEG_TO_RAD
+    sin_ra = np.sin(ra_rad)
+    
+    lon = np.arctan2(sin_ra * cos_eps + np.tan(dec_rad) * sin_eps, np.cos(ra_rad))
+    lat = np.arcsin(np.sin(dec_rad) * cos_eps - np.cos(dec_rad) * sin_eps * sin_ra)
+    
+    epoch = 2000.0 + (jd - JD_EPOCH_2000) / 365.25
+    
+    return epoch, (lon * RAD_TO_DEG) % 360.0, lat * RAD_TO_DEG
+
+
 # ============================================================================
 # Rise/Set Time Calculations
 # ============================================================================
@@ -377,6 +519,10 @@ def rise_set_times(ra: float, dec: float, jd: float,
     """
     Calculate rise and set times for an object.
     
+    The crossing is solved in closed form from the hour angle at the
+    requested altitude rather than by scanning a time grid, so there is no
+    grid density to trade against accuracy.
+    
     Args:
         ra: Right ascension in hours
         dec: Declination in degrees
@@ -402,39 +548,104 @@ def rise_set_times(ra: float, dec: float, jd: float,
             # Never rises above altitude
             return (None, None)
     
-    # Calculate LST at rise and set
-    lst_rise = ra - ha
-    lst_set = ra + ha
+    return _rise_set_jd(ra, ha, jd, lst(jd, longitude))
+
+
+def _rise_set_jd(ra: float, ha: float, jd: float, current_lst: float) -> Tuple[float, float]:
+    """Rise/set JDs after jd for hour angle ha (hours), given the LST at jd."""
+    # Sidereal hours from the LST at jd until the object crosses the
+    # altitude rising (ra - ha) and setting (ra + ha), wrapped to 0-24
+    dt_rise = (ra - ha - current_lst) % 24.0
+    dt_set = (ra + ha - current_lst) % 24.0
     
-    # Normalize to 0-24 hours
-    while lst_rise < 0:
-        lst_rise += 24.0
-    while lst_rise >= 24.0:
-        lst_rise -= 24.0
-    while lst_set < 0:
-        lst_set += 24.0
-    while lst_set >= 24.0:
-        lst_set -= 24.0
-    
-    # Convert LST to JD
-    current_lst = lst(jd, longitude)
+    # Convert to Julian Date (accounting for sidereal vs solar time)
+    jd_rise = jd + (dt_rise * SOLAR_TO_SIDEREAL) / 24.0
+    jd_set = jd + (dt_set * SOLAR_TO_SIDEREAL) / 24.0
     
-    # Calculate time differences
-    dt_rise = lst_rise - current_lst
-    dt_set = lst_set - current_lst
+    return (jd_rise, jd_set)
+
+
+def rise_set_times_batch(ra, dec, jd, longitude: float, latitude: float,
+                         altitude: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate rise and set times for arrays of objects and/or dates.
     
-    # Adjust for wraparound
-    if dt_rise < 0:
-        dt_rise += 24.0
-    if dt_set < 0:
-        dt_set += 24.0
+    Vectorized form of rise_set_times(); ra, dec and jd broadcast against
+    each other.
     
-    # Convert to Julian Date (accounting for sidereal vs solar time)
-    solar_to_sidereal = 365.25 / 366.25
-    jd_rise = jd + (dt_rise * solar_to_sidereal) / 24.0
-    jd_set = jd + (dt_set * solar_to_sidereal) / 24.0
+    Args:
+        ra: Right ascension(s) in hours
+        dec: Declination(s) in degrees
+        jd: Julian Date(s)
+        longitude: Observer longitude in hours (west positive)
+        latitude: Observer latitude in degrees
+        altitude: Altitude threshold in degrees (default horizon)
     
-    return (jd_rise, jd_set)
+    Returns:
+        Tuple of (rise_jd, set_jd) arrays; NaN where the object never rises,
+        (jd, jd + 1) where it never sets
+    """
+    ra, dec, jd = np.broadcast_arrays(np.asarray(ra, dtype=float),
+                                      np.asarray(dec, dtype=float),
+                                      np.asarray(jd, dtype=float))
+    dec_rad = dec * DEG_TO_RAD
+    lat_rad = latitude * DEG_TO_RAD
+    
+    cos_ha = ((math.sin(altitude * DEG_TO_RAD) - np.sin(dec_rad) * math.sin(lat_rad)) /
+              (np.cos(dec_rad) * math.cos(lat_rad)))
+    ha = np.arccos(np.clip(cos_ha, -1.0, 1.0)) * RAD_TO_HOURS
+    
+    current_lst = lst_batch(jd, longitude)
+    jd_rise = jd + ((ra - ha - current_lst) % 24.0) * SOLAR_TO_SIDEREAL / 24.0
+    jd_set = jd + ((ra + ha - current_lst) % 24.0) * SOLAR_TO_SIDEREAL / 24.0
+    
+    # Objects that never cross the altitude: circumpolar or never up
+    never_crosses = np.abs(cos_ha) > 1.0
+    circumpolar = never_crosses & (90.0 - np.abs(latitude - dec) > altitude)
+    jd_rise = np.where(never_crosses, np.where(circumpolar, jd, np.nan), jd_rise)
+    jd_set = np.where(never_crosses, np.where(circumpolar, jd + 1.0, np.nan), jd_set)
+    
+    return jd_rise, jd_set
+
+
+def precompute_rise_set(ra, dec, jd_noon, longitude: float, latitude: float,
+                        altitude: float = 0.0,
+                        filename: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Precompute rise and set times for every field on every night.
+    
+    Intended for simulation runs that revisit the same fields night after
+    night: compute the table once, optionally save it, and index it
+    instead of calling rise_set_times() per field per night.
+    
+    Args:
+        ra: Field right ascensions in hours
+        dec: Field declinations in degrees
+        jd_noon: Julian Dates of noon for each night
+        longitude: Observer longitude in hours (west positive)
+        latitude: Observer latitude in degrees
+        altitude: Altitude threshold in degrees (default horizon)
+        filename: If given, save the table with np.savez_compressed
+            (arrays rise, set, ra, dec, jd; reload with np.load)
+    
+    Returns:
+        Tuple of (rise_jd, set_jd) arrays of shape (n_fields, n_nights),
+        with the same NaN conventions as rise_set_times_batch()
+    """
+    ra = np.atleast_1d(np.asarray(ra, dtype=float))
+    dec = np.atleast_1d(np.asarray(dec, dtype=float))
+    jd_noon = np.atleast_1d(np.asarray(jd_noon, dtype=float))
+    
+    # Fields along axis 0, nights along axis 1
+    jd_rise, jd_set = rise_set_times_batch(ra[:, np.newaxis], dec[:, np.newaxis],
+                                           jd_noon[np.newaxis, :],
+                                           longitude, latitude, altitude)
+    
+    if filename is not None:
+        np.savez_compressed(filename, rise=jd_rise, set=jd_set,
+                            ra=ra, dec=dec, jd=jd_noon)
+    
+    return jd_rise, jd_set
 
 
 # ============================================================================
@@ -451,13 +662,14 @@ def moon_position(jd: float) -> Tuple[float, float, float]:
     Returns:
         Tuple of (ra, dec, illumination) where illumination is 0-1
     """
-    # Time since J2000.0 in Julian centuries
-    t = (jd - JD_EPOCH_2000) / 36525.0
+    # Time since J2000.0 in days and Julian centuries
+    d = jd - JD_EPOCH_2000
+    t = d / 36525.0
     
     # Mean elements of lunar orbit
-    l0 = 218.316 + 13.176396 * (jd - JD_EPOCH_2000)  # Mean longitude
-    m = 134.963 + 13.064993 * (jd - JD_EPOCH_2000)   # Mean anomaly
-    f = 93.272 + 13.229350 * (jd - JD_EPOCH_2000)    # Mean distance from ascending node
+    l0 = 218.316 + 13.176396 * d  # Mean longitude
+    m = 134.963 + 13.064993 * d   # Mean anomaly
+    f = 93.272 + 13.229350 * d    # Mean distance from ascending node
     
     # Convert to radians
     l0_rad = l0 * DEG_TO_RAD
@@ -476,25 +688,25 @@ def moon_position(jd: float) -> Tuple[float, float, float]:
     eps = 23.439291 - 0.0130042 * t
     eps_rad = eps * DEG_TO_RAD
     
-    # Convert to equatorial coordinates
-    ra_rad = math.atan2(math.sin(l_rad) * math.cos(eps_rad) - math.tan(b_rad) * math.sin(eps_rad),
+    # Convert to equatorial coordinates (each shared sine/cosine evaluated once)
+    sin_l = math.sin(l_rad)
+    sin_eps = math.sin(eps_rad)
+    cos_eps = math.cos(eps_rad)
+    ra_rad = math.atan2(sin_l * cos_eps - math.tan(b_rad) * sin_eps,
                         math.cos(l_rad))
-    dec_rad = math.asin(math.sin(b_rad) * math.cos(eps_rad) + 
-                        math.cos(b_rad) * math.sin(eps_rad) * math.sin(l_rad))
+    dec_rad = math.asin(math.sin(b_rad) * cos_eps + 
+                        math.cos(b_rad) * sin_eps * sin_l)
     
     # Convert to hours and degrees
     ra = ra_rad * RAD_TO_HOURS
     dec = dec_rad * RAD_TO_DEG
     
     # Normalize RA
-    while ra < 0:
-        ra += 24.0
-    while ra >= 24.0:
-        ra -= 24.0
+    ra %= 24.0
     
     # Calculate phase (simplified)
     # Sun's mean longitude
-    sun_l = 280.460 + 0.9856474 * (jd - JD_EPOCH_2000)
+    sun_l = 280.460 + 0.9856474 * d
     sun_l_rad = sun_l * DEG_TO_RAD
     
     # Elongation
@@ -506,6 +718,53 @@ def moon_position(jd: float) -> Tuple[float, float, float]:
     return ra, dec, illumination
 
 
+def moon_position_batch(jd) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate approximate moon position and phase for an array of dates.
+    
+    Vectorized form of moon_position().
+    
+    Args:
+        jd: Julian Date(s)
+    
+    Returns:
+        Tuple of (ra, dec, illumination) arrays
+    """
+    jd = np.asarray(jd, dtype=float)
+    
+    # Time since J2000.0 in days and Julian centuries
+    d = jd - JD_EPOCH_2000
+    t = d / 36525.0
+    
+    # Mean elements of lunar orbit
+    l0 = 218.316 + 13.176396 * d  # Mean longitude
+    m = 134.963 + 13.064993 * d   # Mean anomaly
+    f = 93.272 + 13.229350 * d    # Mean distance from ascending node
+    
+    # Corrections
+    l_rad = (l0 + 6.289 * np.sin(m * DEG_TO_RAD)) * DEG_TO_RAD
+    b_rad = (5.128 * np.sin(f * DEG_TO_RAD)) * DEG_TO_RAD
+    
+    # Obliquity of ecliptic
+    eps_rad = (23.439291 - 0.0130042 * t) * DEG_TO_RAD
+    
+    # Convert to equatorial coordinates
+    sin_l = np.sin(l_rad)
+    sin_eps = np.sin(eps_rad)
+    cos_eps = np.cos(eps_rad)
+    ra_rad = np.arctan2(sin_l * cos_eps - np.tan(b_rad) * sin_eps, np.cos(l_rad))
+    dec_rad = np.arcsin(np.sin(b_rad) * cos_eps + np.cos(b_rad) * sin_eps * sin_l)
+    
+    ra = (ra_rad * RAD_TO_HOURS) % 24.0
+    dec = dec_rad * RAD_TO_DEG
+    
+    # Illumination from elongation against the sun's mean longitude
+    sun_l_rad = (280.460 + 0.9856474 * d) * DEG_TO_RAD
+    illumination = 0.5 * (1.0 - np.cos(l_rad - sun_l_rad))
+    
+    return ra, dec, illumination
+
+
 def moon_separation(ra1: float, dec1: float, ra2: float, dec2: float) -> float:
     """
     Calculate angular separation between two celestial positions.
@@ -539,11 +798,99 @@ def moon_separation(ra1: float, dec1: float, ra2: float, dec2: float) -> float:
     return sep_deg
 
 
+def rise_set_times_moon(jd: float, longitude: float, latitude: float,
+                        altitude: float = 0.0,
+                        tolerance_sec: float = 1.0) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Calculate moonrise and moonset times.
+    
+    The moon moves ~13 degrees/day, so rise_set_times() with the position
+    at a single instant can be off by tens of minutes. Each event is
+    refined by re-evaluating moon_position() and the LST at the current
+    estimate until the correction drops below tolerance_sec.
+    
+    Args:
+        jd: Julian Date (noon of the day)
+        longitude: Observer longitude in hours (west positive)
+        latitude: Observer latitude in degrees
+        altitude: Altitude threshold in degrees (default horizon)
+        tolerance_sec: Stop refining once a correction is smaller than this
+    
+    Returns:
+        Tuple of (rise_jd, set_jd), the first events after jd, with the
+        same conventions as rise_set_times()
+    """
+    moon_ra, moon_dec, _ = moon_position(jd)
+    events = list(rise_set_times(moon_ra, moon_dec, jd, longitude, latitude, altitude))
+    if events[0] is None or events == [jd, jd + 1.0]:
+        return tuple(events)
+    
+    # Observer terms are fixed; only the moon's RA/Dec change per pass
+    trig = (math.sin(altitude * DEG_TO_RAD),
+            math.sin(latitude * DEG_TO_RAD),
+            math.cos(latitude * DEG_TO_RAD))
+    tolerance = tolerance_sec / 86400.0
+    
+    for index in (0, 1):  # 0 = rise, 1 = set
+        event = _refine_moon_event(events[index], index, longitude, trig, tolerance)
+        if event < jd:
+            # Converged on the event just before jd; the next one is a lunar day later
+            event = _refine_moon_event(event + _LUNAR_DAY, index, longitude, trig, tolerance)
+        events[index] = event
+    
+    return tuple(events)
+
+
+_LUNAR_DAY = 1.0351  # mean interval between successive moonrises, days
+_MOON_MAX_PASSES = 10
+
+
+def _refine_moon_event(event: float, index: int, longitude: float,
+                       trig: Tuple[float, float, float], tolerance: float) -> float:
+    """Newton-style refinement of one moonrise (index 0) or moonset (index 1) JD."""
+    sin_alt, sin_lat, cos_lat = trig
+    for _ in range(_MOON_MAX_PASSES):
+        moon_ra, moon_dec, _ = moon_position(event)
+        dec_rad = moon_dec * DEG_TO_RAD
+        cos_ha = (sin_alt - math.sin(dec_rad) * sin_lat) / (math.cos(dec_rad) * cos_lat)
+        if abs(cos_ha) > 1.0:
+            break
+        ha = math.acos(cos_ha) * RAD_TO_HOURS
+        target = moon_ra - ha if index == 0 else moon_ra + ha
+        # Sidereal hours from the estimate to the crossing, wrapped to +/-12
+        # so each pass moves to the nearest crossing rather than the next one
+        dt = (target - lst(event, longitude) + 12.0) % 24.0 - 12.0
+        step = dt * SOLAR_TO_SIDEREAL / 24.0
+        event += step
+        if abs(step) < tolerance:
+            break
+    return event
+
+
 # ============================================================================
 # Twilight Calculations
 # ============================================================================
 
-def twilight_times(jd: float, longitude: float, latitude: float) -> dict:
+@dataclass(frozen=True)
+class TwilightTimes:
+    """Sun rise/set and twilight times as Julian Dates (NaN if the event does not occur)"""
+    sunrise: float = math.nan
+    sunset: float = math.nan
+    civil_dawn: float = math.nan
+    civil_dusk: float = math.nan
+    nautical_dawn: float = math.nan
+    nautical_dusk: float = math.nan
+    astronomical_dawn: float = math.nan
+    astronomical_dusk: float = math.nan
+
+
+# Sun altitude thresholds (degrees) for each (dawn, dusk) pair of
+# TwilightTimes fields, in field order; -0.833 accounts for refraction
+# and solar radius
+_TWILIGHT_ALTITUDES = (-0.833, -6.0, -12.0, -18.0)
+
+
+def twilight_times(jd: float, longitude: float, latitude: float) -> TwilightTimes:
     """
     Calculate twilight times for a given date and location.
     
@@ -553,14 +900,8 @@ def twilight_times(jd: float, longitude: float, latitude: float) -> dict:
         latitude: Observatory latitude in degrees
     
     Returns:
-        Dictionary with sunset, sunrise, and twilight times
+        TwilightTimes with sunset, sunrise, and twilight times
     """
-    # Sun altitude thresholds
-    horizon_alt = -0.833  # Accounting for refraction and solar radius
-    civil_alt = -6.0
-    nautical_alt = -12.0
-    astronomical_alt = -18.0
-    
     # Calculate approximate sun position (simplified)
     # This would normally use more accurate solar position algorithm
     n = jd - JD_EPOCH_2000
@@ -577,40 +918,73 @@ def twilight_times(jd: float, longitude: float, latitude: float) -> dict:
     lambda_rad = math.radians(lambda_sun)
     eps_rad = math.radians(eps)
     
-    ra_sun = math.atan2(math.cos(eps_rad) * math.sin(lambda_rad), math.cos(lambda_rad))
-    dec_sun = math.asin(math.sin(eps_rad) * math.sin(lambda_rad))
+    sin_lambda = math.sin(lambda_rad)
+    ra_sun = math.atan2(math.cos(eps_rad) * sin_lambda, math.cos(lambda_rad))
+    dec_sun = math.asin(math.sin(eps_rad) * sin_lambda)
     
     ra_sun_hours = ra_sun * RAD_TO_HOURS
     dec_sun_deg = dec_sun * RAD_TO_DEG
     
+    # Terms shared by every horizon: LST at jd and the sun/latitude products
+    # of hour_angle_from_altitude()
+    current_lst = lst(jd, longitude)
+    dec_rad = dec_sun_deg * DEG_TO_RAD
+    lat_rad = latitude * DEG_TO_RAD
+    sin_dec_sin_lat = math.sin(dec_rad) * math.sin(lat_rad)
+    cos_dec_cos_lat = math.cos(dec_rad) * math.cos(lat_rad)
+    noon_alt = 90.0 - abs(latitude - dec_sun_deg)
+    
     # Calculate rise/set times for different altitudes
-    times = {}
+    times = []
+    for sun_alt in _TWILIGHT_ALTITUDES:
+        cos_ha = (math.sin(sun_alt * DEG_TO_RAD) - sin_dec_sin_lat) / cos_dec_cos_lat
+        if abs(cos_ha) <= 1.0:
+            ha = math.acos(cos_ha) * RAD_TO_HOURS
+            times.extend(_rise_set_jd(ra_sun_hours, ha, jd, current_lst))
+        elif noon_alt > sun_alt:
+            # Sun never drops below this altitude
+            times.extend((jd, jd + 1.0))
+        else:
+            # Sun never rises above this altitude
+            times.extend((math.nan, math.nan))
+    
+    return TwilightTimes(*times)
+
+
+def twilight_times_batch(jd, longitude: float, latitude: float) -> TwilightTimes:
+    """
+    Calculate twilight times for an array of dates.
     
-    # Sunset/sunrise
-    rise_set = rise_set_times(ra_sun_hours, dec_sun_deg, jd, longitude, latitude, horizon_alt)
-    if rise_set[0] and rise_set[1]:
-        times['sunrise'] = rise_set[0]
-        times['sunset'] = rise_set[1]
+    Vectorized form of twilight_times() using the same solar position model.
     
-    # Civil twilight
-    rise_set = rise_set_times(ra_sun_hours, dec_sun_deg, jd, longitude, latitude, civil_alt)
-    if rise_set[0] and rise_set[1]:
-        times['civil_dawn'] = rise_set[0]
-        times['civil_dusk'] = rise_set[1]
+    Args:
+        jd: Julian Dates (noon of each day)
+        longitude: Observatory longitude in hours (west positive)
+        latitude: Observatory latitude in degrees
     
-    # Nautical twilight
-    rise_set = rise_set_times(ra_sun_hours, dec_sun_deg, jd, longitude, latitude, nautical_alt)
-    if rise_set[0] and rise_set[1]:
-        times['nautical_dawn'] = rise_set[0]
-        times['nautical_dusk'] = rise_set[1]
+    Returns:
+        TwilightTimes whose fields are arrays, one entry per date
+        (NaN where the event does not occur)
+    """
+    jd = np.asarray(jd, dtype=float)
     
-    # Astronomical twilight
-    rise_set = rise_set_times(ra_sun_hours, dec_sun_deg, jd, longitude, latitude, astronomical_alt)
-    if rise_set[0] and rise_set[1]:
-        times['astronomical_dawn'] = rise_set[0]
-        times['astronomical_dusk'] = rise_set[1]
+    # Approximate sun position (same model as twilight_times)
+    n = jd - JD_EPOCH_2000
+    L = (280.460 + 0.9856474 * n) % 360.0
+    g = np.radians((357.528 + 0.9856003 * n) % 360.0)
+    lambda_rad = np.radians(L + 1.915 * np.sin(g) + 0.020 * np.sin(2 * g))
+    eps_rad = np.radians(23.439 - 0.0000004 * n)
     
-    return times
+    sin_lambda = np.sin(lambda_rad)
+    ra_sun_hours = np.arctan2(np.cos(eps_rad) * sin_lambda, np.cos(lambda_rad)) * RAD_TO_HOURS
+    dec_sun_deg = np.arcsin(np.sin(eps_rad) * sin_lambda) * RAD_TO_DEG
+    
+    times = []
+    for alt in _TWILIGHT_ALTITUDES:
+        times.extend(rise_set_times_batch(ra_sun_hours, dec_sun_deg, jd,
+                                          longitude, latitude, alt))
+    
+    return TwilightTimes(*times)
 
 
 # ============================================================================
@@ -669,6 +1043,106 @@ def altitude_azimuth(ra: float, dec: float, lst_hours: float, latitude: float) -
     return alt, az
 
 
+def altitude_azimuth_fast(ra: float, dec: float, lst_hours: float,
+                          obs: ObserverTrig) -> Tuple[float, float]:
+    """
+    Calculate altitude and azimuth using precomputed observer trig terms.
+    
+    Same result as altitude_azimuth(), without recomputing sin/cos of the
+    latitude on every call.
+    
+    Args:
+        ra: Right ascension in hours
+        dec: Declination in degrees
+        lst_hours: Local sidereal time in hours
+        obs: Observer trig terms from ObserverTrig.from_latitude()
+    
+    Returns:
+        Tuple of (altitude, azimuth) in degrees
+    """
+    ha_rad = ((lst_hours - ra + 12.0) % 24.0 - 12.0) * HOURS_TO_RAD
+    dec_rad = dec * DEG_TO_RAD
+    sin_dec = math.sin(dec_rad)
+    cos_dec = math.cos(dec_rad)
+    
+    sin_alt = min(1.0, max(-1.0, sin_dec * obs.sin_lat + cos_dec * obs.cos_lat * math.cos(ha_rad)))
+    cos_alt = math.sqrt(max(1e-30, 1.0 - sin_alt * sin_alt))
+    
+    cos_az = (sin_dec - sin_alt * obs.sin_lat) / (cos_alt * obs.cos_lat)
+    sin_az = -math.sin(ha_rad) * cos_dec / cos_alt
+    
+    alt = math.asin(sin_alt) * RAD_TO_DEG
+    az = math.fmod(math.atan2(sin_az, cos_az) * RAD_TO_DEG + 360.0, 360.0)
+    
+    return alt, az
+
+
+def altitude_azimuth_batch(ra, dec, lst_hours, latitude: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate altitude and azimuth for arrays of positions and/or times.
+    
+    Args:
+        ra: Right ascensions in hours
+        dec: Declinations in degrees
+        lst_hours: Local sidereal time(s) in hours (broadcast against ra/dec)
+        latitude: Observer latitude in degrees
+    
+    Returns:
+        Tuple of (altitude, azimuth) arrays in degrees
+    """
+    ra = np.asarray(ra, dtype=float)
+    dec = np.asarray(dec, dtype=float)
+    
+    # Hour angle, wrapped to -12..12
+    ha = (np.asarray(lst_hours, dtype=float) - ra + 12.0) % 24.0 - 12.0
+    
+    ha_rad = ha * HOURS_TO_RAD
+    dec_rad = dec * DEG_TO_RAD
+    lat_rad = latitude * DEG_TO_RAD
+    
+    sin_dec = np.sin(dec_rad)
+    cos_dec = np.cos(dec_rad)
+    sin_lat = math.sin(lat_rad)
+    cos_lat = math.cos(lat_rad)
+    
+    # Altitude, clipped against numerical errors
+    sin_alt = np.clip(sin_dec * sin_lat + cos_dec * cos_lat * np.cos(ha_rad), -1.0, 1.0)
+    alt_rad = np.arcsin(sin_alt)
+    cos_alt = np.cos(alt_rad)
+    
+    # Azimuth, normalized to 0-360
+    cos_az = (sin_dec - sin_alt * sin_lat) / (cos_alt * cos_lat)
+    sin_az = -np.sin(ha_rad) * cos_dec / cos_alt
+    az = (np.arctan2(sin_az, cos_az) * RAD_TO_DEG) % 360.0
+    
+    return alt_rad * RAD_TO_DEG, az
+
+
+def _airmass_secant(cos_z):
+    """Simple secant model (cos_z may be a float or an array)."""
+    return 1.0 / cos_z
+
+
+def _airmass_hardie(cos_z):
+    """Hardie (1962) model (cos_z may be a float or an array)."""
+    sec_z = 1.0 / cos_z
+    return sec_z - 0.0018167 * (sec_z - 1) - 0.002875 * (sec_z - 1)**2 - 0.0008083 * (sec_z - 1)**3
+
+
+def _airmass_young(cos_z):
+    """Young (1994) model (cos_z may be a float or an array)."""
+    return (1.002432 * cos_z**2 + 0.148386 * cos_z + 0.0096467) / \
+           (cos_z**3 + 0.149864 * cos_z**2 + 0.0102963 * cos_z + 0.000303978)
+
+
+# Airmass model name -> formula of cos(zenith angle); unknown names fall back to secant
+_AIRMASS_MODELS = {
+    'secant': _airmass_secant,
+    'hardie': _airmass_hardie,
+    'young': _airmass_young,
+}
+
+
 def airmass(altitude: float, model: str = 'secant') -> float:
     """
     Calculate airmass for given altitude.
@@ -684,28 +1158,29 @@ def airmass(altitude: float, model: str = 'secant') -> float:
         return 999.9  # Below horizon
     
     # Zenith angle
-    z = 90.0 - altitude
-    z_rad = z * DEG_TO_RAD
+    z_rad = (90.0 - altitude) * DEG_TO_RAD
     
-    if model == 'secant':
-        # Simple secant model
-        am = 1.0 / math.cos(z_rad)
+    return _AIRMASS_MODELS.get(model, _airmass_secant)(math.cos(z_rad))
+
+
+def airmass_batch(altitude, model: str = 'secant') -> np.ndarray:
+    """
+    Calculate airmass for an array of altitudes.
     
-    elif model == 'hardie':
-        # Hardie (1962) model
-        sec_z = 1.0 / math.cos(z_rad)
-        am = sec_z - 0.0018167 * (sec_z - 1) - 0.002875 * (sec_z - 1)**2 - 0.0008083 * (sec_z - 1)**3
+    Args:
+        altitude: Altitude(s) in degrees
+        model: Airmass model ('secant', 'hardie', 'young')
     
-    elif model == 'young':
-        # Young (1994) model
-        am = (1.002432 * math.cos(z_rad)**2 + 0.148386 * math.cos(z_rad) + 0.0096467) / \
-             (math.cos(z_rad)**3 + 0.149864 * math.cos(z_rad)**2 + 0.0102963 * math.cos(z_rad) + 0.000303978)
+    Returns:
+        Airmass array (999.9 below horizon)
+    """
+    altitude = np.asarray(altitude, dtype=float)
+    cos_z = np.cos((90.0 - altitude) * DEG_TO_RAD)
     
-    else:
-        # Default to secant model
-        am = 1.0 / math.cos(z_rad)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        am = _AIRMASS_MODELS.get(model, _airmass_secant)(cos_z)
     
-    return am
+    return np.where(altitude <= 0, 999.9, am)
 
 
 def parallactic_angle(ha: float, dec: float, latitude: float) -> float:
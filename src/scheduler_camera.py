@@ -6,8 +6,9 @@ It preserves the original control flow, timing semantics, socket
 protocol, and concurrency model while expressing the logic in Python.
 
 Key features:
-* Threaded execution of long-running camera commands with semaphore
-  handshakes so the caller can overlap telescope slews with CCD readout.
+* Long-running camera commands run on a single reusable daemon worker thread
+  and are tracked with a Future, so the caller can overlap telescope
+  slews with CCD readout.
 * Exposure orchestration that updates FITS headers prior to an exposure,
   imprints those headers on the controller, issues Archon commands, and
   waits for exposure or readout completion based on the configured mode.
@@ -27,14 +28,24 @@ from __future__ import annotations
 import ast
 import logging
 import math
+import queue
+import re
 import socket
 import threading
 import time
+from array import array
+from collections import OrderedDict
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import wait as wait_futures
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from itertools import count
 from typing import Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
+
 
 # ---------------------------------------------------------------------------
 # Constants translated from scheduler_camera.h
@@ -56,6 +67,8 @@ TRANSFER_TIME_SEC = 10
 EXPOSURE_OVERHEAD_HR = (READOUT_TIME_SEC + 5.0) / 3600.0
 
 CAMERA_TIMEOUT_SEC = 5  # default timeout for short commands
+STATUS_POLL_MIN_SEC = 0.25  # first status poll interval after expected end of exposure
+STATUS_POLL_MAX_SEC = 2.0  # cap on the exponential poll backoff
 
 EXP_MODE_SINGLE = "single"
 EXP_MODE_FIRST = "first"
@@ -66,6 +79,9 @@ BAD_ERROR_CODE = 2
 BAD_READOUT_TIME = 60.0
 
 FILENAME_LENGTH = 16
+_SEC_TO_HR = 1.0 / 3600.0
+_HR_TO_SEC = 3600.0
+_MIN_TO_HR = 1.0 / 60.0
 MAXBUFSIZE = 8192
 
 # ---------------------------------------------------------------------------
@@ -100,6 +116,19 @@ EVENING_FLAT_STRING_LC = "e"
 MORNING_FLAT_STRING_LC = "m"
 DOME_FLAT_STRING_LC = "l"
 
+_SHUTTER_TABLE: Dict[int, Tuple[str, str]] = {
+    DARK_CODE: (DARK_STRING_LC, DARK_FIELD_TYPE),
+    SKY_CODE: (SKY_STRING_LC, SKY_FIELD_TYPE),
+    FOCUS_CODE: (FOCUS_STRING_LC, FOCUS_FIELD_TYPE),
+    OFFSET_CODE: (OFFSET_STRING_LC, OFFSET_FIELD_TYPE),
+    EVENING_FLAT_CODE: (EVENING_FLAT_STRING_LC, EVENING_FLAT_TYPE),
+    MORNING_FLAT_CODE: (MORNING_FLAT_STRING_LC, MORNING_FLAT_TYPE),
+    DOME_FLAT_CODE: (DOME_FLAT_STRING_LC, DOME_FLAT_TYPE),
+    BAD_CODE: (BAD_STRING_LC, BAD_FIELD_TYPE),
+}
+_BAD_SHUTTER = (BAD_STRING_LC, BAD_FIELD_TYPE)
+_SHUTTER_CHAR: Dict[int, str] = {code: strings[0] for code, strings in _SHUTTER_TABLE.items()}
+
 # Controller state bookkeeping
 STATE_NAMES: Tuple[str, ...] = (
     "NOSTATUS",
@@ -166,46 +195,55 @@ def set_verbosity(verbose: int, verbose1: Optional[int] = None) -> None:
         _verbose1 = 1 if verbose > 1 else 0
 
 
-def _log_verbose(message: str) -> None:
+def _log_verbose(fmt: str, *args: object) -> None:
+    """Log at info level when verbose; formatting is deferred %-style."""
     if _verbose:
-        logger.info(message)
+        logger.info(fmt, *args)
 
 
-def _log_debug(message: str) -> None:
+def _log_debug(fmt: str, *args: object) -> None:
+    """Log at debug level when verbose1; formatting is deferred %-style."""
     if _verbose1:
-        logger.debug(message)
+        logger.debug(fmt, *args)
+
+
+def _debug_ut() -> float:
+    """UT for debug timestamps; skips the clock read when debugging is off."""
+    return get_ut() if _verbose1 else 0.0
 
 
 # ---------------------------------------------------------------------------
 # Dataclasses that mirror the original C structs
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class FitsWord:
     keyword: str
     value: str
 
 
-@dataclass
+@dataclass(slots=True)
 class FitsHeader:
-    words: List[FitsWord] = field(default_factory=list)
+    # keyword -> value, in insertion (FITS card) order
+    words: "OrderedDict[str, str]" = field(default_factory=OrderedDict)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.words, OrderedDict):
+            # Accept a list of FitsWord records as in the C Fits_Header array
+            self.words = OrderedDict((word.keyword, word.value) for word in self.words)
 
     def update(self, keyword: str, value: str) -> None:
         """Replace or append a FITS keyword/value pair."""
-        for word in self.words:
-            if word.keyword == keyword:
-                word.value = value
-                return
-        self.words.append(FitsWord(keyword=keyword, value=value))
+        self.words[keyword] = value
 
     def __iter__(self) -> Iterable[FitsWord]:
-        return iter(self.words)
+        return (FitsWord(keyword, value) for keyword, value in self.words.items())
 
     def __len__(self) -> int:
         return len(self.words)
 
 
-@dataclass
+@dataclass(slots=True)
 class Field:
     """Subset of Field members needed for camera interactions."""
     expt: float  # exposure time in hours
@@ -213,25 +251,77 @@ class Field:
     script_line: str = ""
     n_done: int = 0
     n_required: int = 0
-    ut: List[float] = field(default_factory=list)
-    jd: List[float] = field(default_factory=list)
-    lst: List[float] = field(default_factory=list)
-    ha: List[float] = field(default_factory=list)
-    actual_expt: List[float] = field(default_factory=list)
-    filename: List[str] = field(default_factory=list)
+    # Per-exposure bookkeeping, one preallocated array per quantity
+    ut: np.ndarray = field(init=False, repr=False, compare=False)
+    jd: np.ndarray = field(init=False, repr=False, compare=False)
+    lst: np.ndarray = field(init=False, repr=False, compare=False)
+    ha: np.ndarray = field(init=False, repr=False, compare=False)
+    actual_expt: np.ndarray = field(init=False, repr=False, compare=False)
+    filename: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._allocate(max(self.n_required, self.n_done + 1))
+
+    def _allocate(self, capacity: int) -> None:
+        n = self.n_done
+        for name in ("ut", "jd", "lst", "ha", "actual_expt"):
+            arr = np.zeros(capacity, dtype=np.float64)
+            if n and hasattr(self, name):
+                arr[:n] = getattr(self, name)[:n]
+            setattr(self, name, arr)
+        names = np.zeros(capacity, dtype=f"U{FILENAME_LENGTH}")
+        if n and hasattr(self, "filename"):
+            names[:n] = self.filename[:n]
+        self.filename = names
 
     def record_observation(self, ut: float, jd: float, lst: float, ha: float, actual_exposure_sec: float, filename: str) -> None:
-        """Append bookkeeping for a completed exposure."""
-        self.ut.append(ut)
-        self.jd.append(jd)
-        self.lst.append(lst)
-        self.ha.append(ha)
-        self.actual_expt.append(actual_exposure_sec / 3600.0)
-        self.filename.append(filename[:FILENAME_LENGTH])
-        self.n_done += 1
-
-
-@dataclass
+        """Store bookkeeping for a completed exposure."""
+        i = self.n_done
+        if i >= len(self.ut):
+            self._allocate(2 * len(self.ut))
+        self.ut[i] = ut
+        self.jd[i] = jd
+        self.lst[i] = lst
+        self.ha[i] = ha
+        self.actual_expt[i] = actual_exposure_sec * _SEC_TO_HR
+        self.filename[i] = filename[:FILENAME_LENGTH]
+        self.n_done = i + 1
+
+    @property
+    def ut_used(self) -> np.ndarray:
+        return self.ut[: self.n_done]
+
+    @property
+    def jd_used(self) -> np.ndarray:
+        return self.jd[: self.n_done]
+
+    @property
+    def lst_used(self) -> np.ndarray:
+        return self.lst[: self.n_done]
+
+    @property
+    def ha_used(self) -> np.ndarray:
+        return self.ha[: self.n_done]
+
+    @property
+    def actual_expt_used(self) -> np.ndarray:
+        return self.actual_expt[: self.n_done]
+
+    @property
+    def filename_used(self) -> np.ndarray:
+        return self.filename[: self.n_done]
+
+    def total_exposure_hr(self) -> float:
+        """Total actual exposure time recorded so far, in hours."""
+        return float(self.actual_expt[: self.n_done].sum())
+
+    def mean_ha(self) -> float:
+        """Mean hour angle of the recorded exposures (0.0 if none)."""
+        n = self.n_done
+        return float(self.ha[:n].mean()) if n else 0.0
+
+
+@dataclass(slots=True)
 class ControllerState:
     nostatus: int = 0
     unknown: int = 0
@@ -254,7 +344,7 @@ class ControllerState:
     errored: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraStatus:
     ready: bool = False
     error: bool = False
@@ -263,7 +353,7 @@ class CameraStatus:
     comment: str = ""
     date: str = ""
     read_time: float = 0.0
-    state_val: List[int] = field(default_factory=lambda: [0] * NUM_STATES)
+    state_val: array = field(default_factory=lambda: array("i", [0]) * NUM_STATES)
     cmd_error: bool = False
     cmd_error_msg: str = ""
     cmd_command: str = ""
@@ -271,7 +361,7 @@ class CameraStatus:
     cmd_reply: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ExposureResult:
     filename: str
     ut_hours: float
@@ -282,35 +372,32 @@ class ExposureResult:
     waited_for_readout: bool
 
 
-@dataclass
-class _DoCommandArgs:
-    command: str
-    timeout: int
-    start_semaphore: threading.Semaphore
-    done_semaphore: threading.Semaphore
-    command_id: int
-    reply_holder: List[str]
-    result_holder: List[int]
-
-
 # ---------------------------------------------------------------------------
 # Module globals that mirror the C file's static state
 # ---------------------------------------------------------------------------
 
-command_start_semaphore = threading.Semaphore(0)
-command_done_semaphore = threading.Semaphore(0)
-
 status_channel_active = False
 readout_pending = False
 
 cam_status = CameraStatus()
 _host_name = socket.gethostname()
 
+# next() on itertools.count is atomic under the GIL, so no lock is needed
 _command_counter = count(0)
-_command_id_lock = threading.Lock()
 
 _t_exp_start_monotonic = 0.0
 
+_last_status_reply: Optional[str] = None
+_last_status_monotonic = 0.0
+
+# Idle controller connections keyed by (host, port); see send_command
+_conn_pool: Dict[Tuple[str, int], List[socket.socket]] = {}
+_conn_pool_lock = threading.Lock()
+
+# Job queues of the daemon worker threads, keyed by thread name; see _submit
+_worker_queues: Dict[str, "queue.SimpleQueue"] = {}
+_readout_future: Optional[Future] = None
+
 
 def set_host_name(host: str) -> None:
     """Override the default host name used for camera connections."""
@@ -324,12 +411,33 @@ def configure_status_channel(active: bool) -> None:
     status_channel_active = active
 
 
-def init_semaphores() -> None:
-    """Reset the command synchronization semaphores (parity with C helper)."""
-    global command_start_semaphore, command_done_semaphore
-    command_start_semaphore = threading.Semaphore(0)
-    command_done_semaphore = threading.Semaphore(0)
-    _log_debug("init_semaphores: start and done semaphores reset")
+def _run_worker(jobs: "queue.SimpleQueue") -> None:
+    """Run queued (future, fn, args) jobs for the life of the process."""
+    while True:
+        future, fn, args = jobs.get()
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            future.set_result(fn(*args))
+        except BaseException as exc:  # noqa: BLE001 delivered through the future
+            future.set_exception(exc)
+
+
+def _submit(worker: str, fn, *args) -> Future:
+    """Run fn(*args) on the named reusable worker thread and return its Future.
+
+    Workers are daemon threads, like the C code's detached command thread,
+    so exiting (or Ctrl-C) with an exposure in flight does not wait for the
+    expose command to return or time out.  ThreadPoolExecutor workers are
+    joined at interpreter exit, which is why it is not used here.
+    """
+    jobs = _worker_queues.get(worker)
+    if jobs is None:
+        jobs = _worker_queues[worker] = queue.SimpleQueue()
+        threading.Thread(target=_run_worker, args=(jobs,), name=worker, daemon=True).start()
+    future: Future = Future()
+    jobs.put((future, fn, args))
+    return future
 
 
 # ---------------------------------------------------------------------------
@@ -343,9 +451,21 @@ def get_tm() -> Tuple[datetime, float]:
     return now, ut_hours
 
 
+_UT_CACHE_SEC = 0.01  # get_ut() results are reused for this long
+_ut_cache_monotonic = -1.0
+_ut_cache_value = 0.0
+
+
 def get_ut() -> float:
-    """Return fractional UT hours since midnight."""
-    return get_tm()[1]
+    """Return fractional UT hours since midnight (cached for _UT_CACHE_SEC)."""
+    global _ut_cache_monotonic, _ut_cache_value
+    now_monotonic = time.monotonic()
+    if now_monotonic - _ut_cache_monotonic < _UT_CACHE_SEC:
+        return _ut_cache_value
+    now = datetime.now(timezone.utc)
+    _ut_cache_value = now.hour + now.minute * _MIN_TO_HR + (now.second + now.microsecond * 1e-6) * _SEC_TO_HR
+    _ut_cache_monotonic = now_monotonic
+    return _ut_cache_value
 
 
 def julian_date(dt: datetime) -> float:
@@ -358,12 +478,25 @@ def julian_date(dt: datetime) -> float:
     if month <= 2:
         year -= 1
         month += 12
-    A = math.floor(year / 100)
-    B = 2 - A + math.floor(A / 4)
-    jd = math.floor(365.25 * (year + 4716)) + math.floor(30.6001 * (month + 1)) + day + B - 1524.5
+    # All terms are positive for CE dates, so int() truncation equals floor
+    A = year // 100
+    B = 2 - A + A // 4
+    jd = int(365.25 * (year + 4716)) + int(30.6001 * (month + 1)) + day + B - 1524.5
     return jd
 
 
+def julian_date_batch(years: np.ndarray, months: np.ndarray, days_frac: np.ndarray) -> np.ndarray:
+    """Vectorized julian_date for arrays of year, month and fractional UTC day."""
+    years = np.asarray(years, dtype=np.int64)
+    months = np.asarray(months, dtype=np.int64)
+    adj = months <= 2
+    years = np.where(adj, years - 1, years)
+    months = np.where(adj, months + 12, months)
+    A = years // 100
+    B = 2 - A + A // 4
+    return np.floor(365.25 * (years + 4716)) + np.floor(30.6001 * (months + 1)) + days_frac + B - 1524.5
+
+
 def get_jd() -> float:
     """Return the current Julian Date."""
     now = datetime.now(timezone.utc)
@@ -376,13 +509,14 @@ def get_jd() -> float:
 
 def imprint_fits_header(header: FitsHeader) -> int:
     """Send header keyword/value pairs to the camera controller."""
+    commands = [f"{HEADER_COMMAND} {keyword} {value}" for keyword, value in header.words.items()]
+    if not commands:
+        return 0
     next_id = _next_command_id()
-    for word in header:
-        command = f"header {word.keyword} {word.value}"
-        rc, reply = do_camera_command(command, CAMERA_TIMEOUT_SEC, next_id, _host_name)
-        if rc != 0:
-            _log_verbose(f"imprint_fits_header: error sending {command}: {reply}")
-            return -1
+    rc, reply = do_command_batch(commands, CAMERA_TIMEOUT_SEC, COMMAND_PORT, next_id, _host_name)
+    if rc != 0:
+        _log_verbose("imprint_fits_header: error sending header: %s", reply)
+        return -1
     return 0
 
 
@@ -392,47 +526,34 @@ def imprint_fits_header(header: FitsHeader) -> int:
 
 def get_shutter_string(shutter: int) -> Tuple[str, str]:
     """Return shutter keyword and description string."""
-    if shutter == DARK_CODE:
-        return DARK_STRING_LC, DARK_FIELD_TYPE
-    if shutter == SKY_CODE:
-        return SKY_STRING_LC, SKY_FIELD_TYPE
-    if shutter == FOCUS_CODE:
-        return FOCUS_STRING_LC, FOCUS_FIELD_TYPE
-    if shutter == OFFSET_CODE:
-        return OFFSET_STRING_LC, OFFSET_FIELD_TYPE
-    if shutter == EVENING_FLAT_CODE:
-        return EVENING_FLAT_STRING_LC, EVENING_FLAT_TYPE
-    if shutter == MORNING_FLAT_CODE:
-        return MORNING_FLAT_STRING_LC, MORNING_FLAT_TYPE
-    if shutter == DOME_FLAT_CODE:
-        return DOME_FLAT_STRING_LC, DOME_FLAT_TYPE
-    if shutter == BAD_CODE:
-        return BAD_STRING_LC, BAD_FIELD_TYPE
-    return BAD_STRING_LC, BAD_FIELD_TYPE
+    return _SHUTTER_TABLE.get(shutter, _BAD_SHUTTER)
 
 
 def get_filename(timestamp: datetime, shutter: int) -> str:
     """Construct file name root yyyymmddHHMMSSx."""
-    shutter_code, _ = get_shutter_string(shutter)
+    shutter_code = _SHUTTER_CHAR.get(shutter, BAD_STRING_LC)
     return timestamp.strftime(f"%Y%m%d%H%M%S{shutter_code}")
 
 
+# Reply timeout (before margin) for a waiting exposure, given exposure + readout seconds
+_EXPOSE_TIMEOUT_FNS = {
+    EXP_MODE_SINGLE: lambda exp_readout: exp_readout + TRANSFER_TIME_SEC,
+    EXP_MODE_FIRST: lambda exp_readout: exp_readout,
+    EXP_MODE_NEXT: lambda exp_readout: max(exp_readout, TRANSFER_TIME_SEC),
+    EXP_MODE_LAST: lambda exp_readout: TRANSFER_TIME_SEC,
+}
+
+
 def expose_timeout(exp_mode: str, exp_time_sec: float, wait_flag: bool) -> int:
     """Compute timeout in seconds for exposure replies."""
-    exp_time = float(exp_time_sec)
+    exp_readout = float(exp_time_sec) + READOUT_TIME_SEC
     if not wait_flag:
-        t = exp_time + READOUT_TIME_SEC
+        t = exp_readout
     else:
-        if EXP_MODE_SINGLE in exp_mode:
-            t = exp_time + READOUT_TIME_SEC + TRANSFER_TIME_SEC
-        elif EXP_MODE_FIRST in exp_mode:
-            t = exp_time + READOUT_TIME_SEC
-        elif EXP_MODE_NEXT in exp_mode:
-            t = max(exp_time + READOUT_TIME_SEC, TRANSFER_TIME_SEC)
-        elif EXP_MODE_LAST in exp_mode:
-            t = TRANSFER_TIME_SEC
-        else:
+        timeout_fn = _EXPOSE_TIMEOUT_FNS.get(exp_mode)
+        if timeout_fn is None:
             raise ValueError(f"Unrecognized exposure mode '{exp_mode}'")
+        t = timeout_fn(exp_readout)
     return int(math.ceil(t + 5.0))
 
 
@@ -440,15 +561,15 @@ def expose_timeout(exp_mode: str, exp_time_sec: float, wait_flag: bool) -> int:
 # Status parsing utilities translated from scheduler_status.c
 # ---------------------------------------------------------------------------
 
+_STATUS_PAYLOAD_RE = re.compile(r"\{.*\}", re.S)
+
+
+@lru_cache(maxsize=32)
 def binary_string_to_int(binary: str) -> int:
-    if not binary:
+    bits = binary.strip()
+    if not bits or bits.strip("01"):
         return 0
-    result = 0
-    for char in binary.strip():
-        if char not in "01":
-            return 0
-        result = (result << 1) | (ord(char) - ord("0"))
-    return result
+    return int(bits, 2)
 
 
 def parse_status(reply: str, status: Optional[CameraStatus] = None) -> CameraStatus:
@@ -456,11 +577,11 @@ def parse_status(reply: str, status: Optional[CameraStatus] = None) -> CameraSta
     status = status or CameraStatus()
     status.read_time = time.time()
 
+    match = _STATUS_PAYLOAD_RE.search(reply)
+    if match is None:
+        raise ValueError(f"Unable to parse status payload: {reply}")
     try:
-        start = reply.index("{")
-        end = reply.rindex("}")
-        payload = reply[start : end + 1]
-        data = ast.literal_eval(payload)
+        data = ast.literal_eval(match.group())
     except (ValueError, SyntaxError) as exc:
         raise ValueError(f"Unable to parse status payload: {reply}") from exc
 
@@ -471,9 +592,9 @@ def parse_status(reply: str, status: Optional[CameraStatus] = None) -> CameraSta
     status.comment = str(data.get("comment", ""))
     status.date = str(data.get("date", ""))
 
-    for idx, name in enumerate(STATE_NAMES):
-        raw_val = data.get(name, "0000")
-        status.state_val[idx] = binary_string_to_int(str(raw_val))
+    get = data.get
+    to_int = binary_string_to_int
+    status.state_val[:] = array("i", [to_int(str(get(name, "0000"))) for name in STATE_NAMES])
 
     status.cmd_error = bool(data.get("cmd_error", False))
     status.cmd_error_msg = str(data.get("cmd_error_msg", ""))
@@ -486,11 +607,18 @@ def parse_status(reply: str, status: Optional[CameraStatus] = None) -> CameraSta
 
 def update_camera_status(status: Optional[CameraStatus] = None) -> Tuple[int, Optional[str]]:
     """Query controller status and update the global CameraStatus."""
-    next_id = _next_command_id()
-    rc, reply = do_status_command(STATUS_COMMAND, CAMERA_TIMEOUT_SEC, next_id, _host_name)
-    if rc != 0:
-        return rc, reply
-    global cam_status
+    global cam_status, _last_status_reply, _last_status_monotonic
+    now = time.monotonic()
+    if _last_status_reply is not None and now - _last_status_monotonic < COMMAND_DELAY_USEC / 1_000_000.0:
+        # Reuse a reply fetched within the last command delay
+        reply = _last_status_reply
+    else:
+        next_id = _next_command_id()
+        rc, reply = do_status_command(STATUS_COMMAND, CAMERA_TIMEOUT_SEC, next_id, _host_name)
+        if rc != 0:
+            return rc, reply
+        _last_status_reply = reply
+        _last_status_monotonic = time.monotonic()
     cam_status = parse_status(reply, status or cam_status)
     return 0, reply
 
@@ -500,38 +628,191 @@ def update_camera_status(status: Optional[CameraStatus] = None) -> Tuple[int, Op
 # ---------------------------------------------------------------------------
 
 def _next_command_id() -> int:
-    with _command_id_lock:
-        return next(_command_counter)
+    return next(_command_counter)
 
 
-def send_command(command: str, host: str, port: int, timeout_sec: int) -> str:
-    """Send a command string and return the raw reply."""
-    command_bytes = command.encode("utf-8")
-    address = (host, port)
-    _log_debug(f"send_command[{port}]: {get_ut():12.6f} connecting to {host}:{port} command='{command}' timeout={timeout_sec}")
+_REPLY_END = ord("]")
+# Controller replies open with "[DONE" or "[ERROR" (see scheduler_status.c)
+_REPLY_HEADER_RE = re.compile(rb"\[\s*(?:DONE|ERROR)")
+_WHITESPACE = b" \t\r\n"
+_recv_local = threading.local()
+
+
+def _recv_buffer() -> bytearray:
+    """Per-thread reply buffer reused across commands."""
+    buf = getattr(_recv_local, "buf", None)
+    if buf is None:
+        buf = _recv_local.buf = bytearray(MAXBUFSIZE)
+    return buf
+
+
+def _open_connection(host: str, port: int, timeout_sec: int) -> socket.socket:
+    sock = socket.create_connection((host, port), timeout=timeout_sec)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    return sock
+
+
+def _get_connection(host: str, port: int, timeout_sec: int) -> Tuple[socket.socket, bool]:
+    """Check out an idle pooled connection, or open a new one.
+
+    Returns the socket and whether it was reused from the pool.
+    """
+    with _conn_pool_lock:
+        idle = _conn_pool.get((host, port))
+        if idle:
+            return idle.pop(), True
+    return _open_connection(host, port, timeout_sec), False
+
+
+def _release_connection(host: str, port: int, sock: socket.socket) -> None:
+    with _conn_pool_lock:
+        _conn_pool.setdefault((host, port), []).append(sock)
+
+
+def close_connections() -> None:
+    """Close all pooled controller connections (call at shutdown)."""
+    with _conn_pool_lock:
+        socks = [sock for idle in _conn_pool.values() for sock in idle]
+        _conn_pool.clear()
+    for sock in socks:
+        try:
+            sock.close()
+        except OSError:
+            pass
+
+
+def _send_on(sock: socket.socket, payload: bytes, host: str, port: int, timeout_sec: int) -> Tuple[bytes, bool]:
+    """Send one newline-terminated command on an open connection and read its reply.
+
+    Returns the raw reply and whether it was terminated by "]" (as opposed
+    to the peer closing the connection).
+    """
+    sock.settimeout(timeout_sec)
+    sock.sendall(payload)
+    buf = _recv_buffer()
+    total = 0
+    while True:
+        if total == len(buf):
+            buf.extend(bytes(len(buf)))  # grow only on overflow
+        try:
+            with memoryview(buf) as view:
+                n = sock.recv_into(view[total:])
+        except socket.timeout as exc:
+            raise TimeoutError(f"timeout waiting for reply from {host}:{port}") from exc
+        if n == 0:
+            return bytes(buf[:total]), False
+        total += n
+        last = buf[total - 1]
+        if last == _REPLY_END or (last in _WHITESPACE and buf[:total].rstrip().endswith(b"]")):
+            return bytes(buf[:total]), True
+
+
+def send_commands(commands: List[str], host: str, port: int, timeout_sec: int) -> List[str]:
+    """Pipeline several commands on one pooled connection and return the replies.
+
+    All commands are written before any reply is read.  Payloads may contain
+    "]", so a reply is only split off once the next reply header arrives;
+    the last one ends on a trailing "]" as in send_command().  If the
+    controller closes the connection part way through, the unanswered
+    commands are resent one at a time with send_command().
+    """
+    payload = "".join(f"{command}\n" for command in commands).encode("utf-8")
+    _log_debug("send_commands[%d]: %12.6f pipelining %d commands to %s:%d", port, _debug_ut(), len(commands), host, port)
+    replies: List[bytes] = []
     try:
-        with socket.create_connection(address, timeout=timeout_sec) as sock:
+        sock, _ = _get_connection(host, port, timeout_sec)
+        try:
             sock.settimeout(timeout_sec)
-            sock.sendall(command_bytes)
-            sock.sendall(b"\n")
-            chunks: List[bytes] = []
-            while True:
+            sock.sendall(payload)
+            buf = b""
+            while len(replies) < len(commands):
+                head = _REPLY_HEADER_RE.search(buf)
+                following = _REPLY_HEADER_RE.search(buf, head.end()) if head else None
+                if following is not None:
+                    replies.append(buf[head.start() : following.start()])
+                    buf = buf[following.start() :]
+                    continue
+                last = len(replies) == len(commands) - 1
+                if head is not None and last and buf.rstrip().endswith(b"]"):
+                    replies.append(buf[head.start() :])
+                    break
                 try:
                     chunk = sock.recv(MAXBUFSIZE)
                 except socket.timeout as exc:
                     raise TimeoutError(f"timeout waiting for reply from {host}:{port}") from exc
                 if not chunk:
+                    if head is not None and buf.rstrip().endswith(b"]"):
+                        # Peer closed right after a complete reply
+                        replies.append(buf[head.start() :])
                     break
-                chunks.append(chunk)
-                if chunk.strip().endswith(b"]"):
-                    break
-            reply = b"".join(chunks).decode("utf-8", errors="replace").strip()
-            _log_debug(f"send_command[{port}]: {get_ut():12.6f} reply='{reply}'")
-            return reply
+                buf += chunk
+        except ConnectionError:
+            sock.close()
+            sock = None
+        except BaseException:
+            sock.close()
+            raise
+        if sock is not None:
+            if len(replies) == len(commands):
+                _release_connection(host, port, sock)
+            else:
+                sock.close()
+    except OSError as exc:
+        raise ConnectionError(f"send_commands[{port}] failed: {exc}") from exc
+
+    decoded = [raw.decode("utf-8", errors="replace").strip() for raw in replies]
+    for command in commands[len(decoded):]:
+        decoded.append(send_command(command, host, port, timeout_sec))
+    return decoded
+
+
+def send_command(command: str, host: str, port: int, timeout_sec: int) -> str:
+    """Send a command string on a pooled connection and return the raw reply."""
+    payload = f"{command}\n".encode("utf-8")
+    _log_debug("send_command[%d]: %12.6f sending to %s:%d command='%s' timeout=%s", port, _debug_ut(), host, port, command, timeout_sec)
+    try:
+        sock, reused = _get_connection(host, port, timeout_sec)
+        try:
+            try:
+                raw, complete = _send_on(sock, payload, host, port, timeout_sec)
+            except ConnectionError:
+                if not reused:
+                    raise
+                raw, complete = b"", False
+            if not raw and reused:
+                # Controller dropped the idle connection; retry once on a fresh one
+                sock.close()
+                sock = _open_connection(host, port, timeout_sec)
+                raw, complete = _send_on(sock, payload, host, port, timeout_sec)
+        except BaseException:
+            sock.close()
+            raise
+        if complete:
+            _release_connection(host, port, sock)
+        else:
+            sock.close()
+        reply = raw.decode("utf-8", errors="replace").strip()
+        _log_debug("send_command[%d]: %12.6f reply='%s'", port, _debug_ut(), reply)
+        return reply
     except OSError as exc:
         raise ConnectionError(f"send_command[{port}] failed: {exc}") from exc
 
 
+def _reply_ok(command: str, reply: str, command_id: int) -> bool:
+    if not reply or DONE_REPLY not in reply or "ERROR_REPLY" in reply or ERROR_REPLY in reply:
+        logger.error(
+            "do_command[%d]: %12.6f : command '%s' returned error reply: %s",
+            command_id,
+            get_ut(),
+            command,
+            reply,
+        )
+        return False
+    _log_debug("do_command[%d]: %12.6f reply '%s'", command_id, _debug_ut(), reply)
+    return True
+
+
 def do_command(command: str, timeout_sec: int, port: int, command_id: int, host: Optional[str]) -> Tuple[int, str]:
     """Low-level command dispatcher that mirrors the C logic."""
     target_host = host or _host_name
@@ -543,20 +824,33 @@ def do_command(command: str, timeout_sec: int, port: int, command_id: int, host:
 
     time.sleep(COMMAND_DELAY_USEC / 1_000_000.0)
 
-    if not reply or DONE_REPLY not in reply or "ERROR_REPLY" in reply or ERROR_REPLY in reply:
-        logger.error(
-            "do_command[%d]: %12.6f : command '%s' returned error reply: %s",
-            command_id,
-            get_ut(),
-            command,
-            reply,
-        )
+    if not _reply_ok(command, reply, command_id):
         return -1, reply
-
-    _log_debug(f"do_command[{command_id}]: {get_ut():12.6f} reply '{reply}'")
     return 0, reply
 
 
+def do_command_batch(
+    commands: List[str], timeout_sec: int, port: int, command_id: int, host: Optional[str]
+) -> Tuple[int, str]:
+    """Pipeline several commands and pause COMMAND_DELAY_USEC once at the end.
+
+    Returns the first error reply, or the last reply if all succeeded.
+    """
+    target_host = host or _host_name
+    try:
+        replies = send_commands(commands, target_host, port, timeout_sec)
+    except Exception as exc:  # noqa: BLE001 we want to pass through all socket errors
+        logger.error("do_command_batch[%d]: %s", command_id, exc)
+        return -1, str(exc)
+
+    time.sleep(COMMAND_DELAY_USEC / 1_000_000.0)
+
+    for command, reply in zip(commands, replies):
+        if not _reply_ok(command, reply, command_id):
+            return -1, reply
+    return 0, replies[-1]
+
+
 def do_camera_command(command: str, timeout_sec: int, command_id: int, host: Optional[str]) -> Tuple[int, str]:
     return do_command(command, timeout_sec, COMMAND_PORT, command_id, host)
 
@@ -566,52 +860,58 @@ def do_status_command(command: str, timeout_sec: int, command_id: int, host: Opt
 
 
 # ---------------------------------------------------------------------------
-# Thread orchestration replicating do_camera_command_thread
+# Exposure orchestration
 # ---------------------------------------------------------------------------
 
-def do_camera_command_thread(args: _DoCommandArgs) -> None:
-    """Thread target replicating the C worker."""
-    start_time = get_ut()
-    _log_debug(
-        f"do_camera_command_thread[{args.command_id}]: {start_time:12.6f} waiting for start semaphore timeout={args.timeout}"
-    )
-    try:
-        acquired = args.start_semaphore.acquire(timeout=args.timeout)
-        if not acquired:
-            logger.error(
-                "do_camera_command_thread[%d]: %12.6f timeout waiting to start", args.command_id, get_ut()
-            )
-            args.result_holder[0] = -1
-            args.reply_holder[0] = "timeout waiting for start semaphore"
-            return
-        _log_debug(
-            f"do_camera_command_thread[{args.command_id}]: {get_ut():12.6f} issuing command '{args.command}'"
-        )
-        rc, reply = do_camera_command(args.command, args.timeout, args.command_id, _host_name)
-        args.result_holder[0] = rc
-        args.reply_holder[0] = reply
-    finally:
-        args.done_semaphore.release()
-        _log_debug(
-            f"do_camera_command_thread[{args.command_id}]: {get_ut():12.6f} posted done semaphore"
-        )
-
+def _wait_readout_future(timeout_sec: float) -> bool:
+    """Sleep up to timeout_sec, waking early if the pending expose command returns.
+
+    Returns True if the expose command has completed.
+    """
+    future = _readout_future
+    if future is None:
+        time.sleep(max(0.0, timeout_sec))
+        return False
+    wait_futures([future], timeout=max(0.0, timeout_sec))
+    return future.done()
+
+
+def _readout_failed() -> bool:
+    """True if the pending expose command has returned with an error or raised."""
+    future = _readout_future
+    if future is None or not future.done():
+        return False
+    if future.exception() is not None:
+        logger.error("wait_exp_done: exposure command raised: %s", future.exception())
+        return True
+    rc, reply = future.result()
+    if rc != 0:
+        logger.error("wait_exp_done: exposure command failed: %s", reply)
+        return True
+    return False
 
-# ---------------------------------------------------------------------------
-# Exposure orchestration
-# ---------------------------------------------------------------------------
 
 def wait_exp_done(expected_exposure_sec: float) -> float:
-    """Wait for an exposure to complete, optionally polling status channel."""
+    """Wait for an exposure to complete, optionally polling status channel.
+
+    Returns the time waited in seconds, or -1.0 on timeout or if the expose
+    command failed.
+    """
+    if not status_channel_active:
+        time.sleep(max(0.0, expected_exposure_sec))
+        return -1.0 if _readout_failed() else expected_exposure_sec
+
     timeout_sec = int(expected_exposure_sec + 5)
     _log_debug(
-        f"wait_exp_done: {get_ut():12.6f} waiting up to {timeout_sec} sec for exposure completion"
+        "wait_exp_done: %12.6f waiting up to %d sec for exposure completion", _debug_ut(), timeout_sec
     )
-    time.sleep(max(0.0, expected_exposure_sec))
-
-    if not status_channel_active:
-        return expected_exposure_sec
+    if _wait_readout_future(expected_exposure_sec):
+        # The expose command has already returned, so the exposure is over
+        return -1.0 if _readout_failed() else expected_exposure_sec
 
+    # Poll only for overruns, backing off so long overruns are not hammered;
+    # the first pass reads fresh status, so a finished exposure returns at once
+    poll_sec = STATUS_POLL_MIN_SEC
     deadline = time.time() + timeout_sec
     while time.time() < deadline:
         rc, reply = update_camera_status()
@@ -619,44 +919,55 @@ def wait_exp_done(expected_exposure_sec: float) -> float:
             logger.error("wait_exp_done: unable to update camera status: %s", reply)
             break
         if cam_status.state_val[EXPOSING] == ALL_NEGATIVE_VAL:
-            _log_debug(
-                f"wait_exp_done: {get_ut():12.6f} exposure finished via status channel"
-            )
+            _log_debug("wait_exp_done: %12.6f exposure finished via status channel", _debug_ut())
+            return max(0.0, expected_exposure_sec - (deadline - time.time()))
+        if _wait_readout_future(min(poll_sec, deadline - time.time())):
+            if _readout_failed():
+                return -1.0
+            _log_debug("wait_exp_done: %12.6f exposure finished via command reply", _debug_ut())
             return max(0.0, expected_exposure_sec - (deadline - time.time()))
-        time.sleep(0.1)
+        poll_sec = min(poll_sec * 2.0, STATUS_POLL_MAX_SEC)
 
     logger.error("wait_exp_done: %12.6f timeout waiting for exposure completion", get_ut())
     return -1.0
 
 
 def wait_camera_readout(status: Optional[CameraStatus] = None) -> int:
-    """Wait for asynchronous readout to complete when using non-blocking exposures."""
-    global readout_pending, cam_status
-    if not readout_pending:
+    """Wait for asynchronous readout to complete when using non-blocking exposures.
+
+    Returns 0 on success, or -1 if the readout timed out or the expose
+    command failed.
+    """
+    global readout_pending, cam_status, _readout_future
+    if not readout_pending or _readout_future is None:
         _log_debug("wait_camera_readout: no readout pending")
         return 0
 
-    timeout_sec = READOUT_TIME_SEC
-    end_time = time.time() + timeout_sec
-    while time.time() < end_time:
-        acquired = command_done_semaphore.acquire(blocking=False)
-        if acquired:
-            readout_pending = False
-            _log_debug(
-                f"wait_camera_readout: {get_ut():12.6f} readout complete"
-            )
-            if status is not None:
-                status.read_time = cam_status.read_time
-                status.state_val = cam_status.state_val.copy()
-                status.ready = cam_status.ready
-                status.error = cam_status.error
-            return 0
-        time.sleep(0.1)
-
-    logger.error(
-        "wait_camera_readout: %12.6f timeout waiting for readout completion", get_ut()
-    )
-    return -1
+    try:
+        rc, reply = _readout_future.result(timeout=READOUT_TIME_SEC)
+    except FutureTimeoutError:
+        logger.error(
+            "wait_camera_readout: %12.6f timeout waiting for readout completion", get_ut()
+        )
+        return -1
+    except Exception as exc:  # noqa: BLE001 the worker may raise any socket error
+        readout_pending = False
+        _readout_future = None
+        logger.error("wait_camera_readout: exposure command raised: %s", exc)
+        return -1
+
+    readout_pending = False
+    _readout_future = None
+    if rc != 0:
+        logger.error("wait_camera_readout: exposure command failed: %s", reply)
+        return rc
+    _log_debug("wait_camera_readout: %12.6f readout complete", _debug_ut())
+    if status is not None:
+        status.read_time = cam_status.read_time
+        status.state_val = cam_status.state_val[:]
+        status.ready = cam_status.ready
+        status.error = cam_status.error
+    return 0
 
 
 def clear_camera(host: Optional[str] = None) -> int:
@@ -670,6 +981,39 @@ def clear_camera(host: Optional[str] = None) -> int:
     return rc
 
 
+def _update_field_header(field: Field, header: FitsHeader, sequence: int, filename: Optional[str]) -> None:
+    """Set the per-exposure header keywords (flatfile only if filename is given)."""
+    _, field_description = get_shutter_string(field.shutter)
+    header.update("sequence", str(sequence))
+    header.update("imagetyp", field_description)
+    if filename is not None:
+        header.update("flatfile", filename)
+
+    comment = "no comment"
+    if "#" in field.script_line:
+        comment = field.script_line.split("#", 1)[1].strip()
+    header.update("comment", f"'{comment}'")
+
+
+def prepare_next_header(field: Field, header: FitsHeader, sequence: int) -> Future:
+    """Imprint the header for exposure number ``sequence`` of ``field`` in the background.
+
+    ``sequence`` is 1-based.  While an exposure of ``field`` is still in
+    flight it has not been recorded yet, so the next one is
+    ``field.n_done + 2`` rather than ``field.n_done + 1``.  The keywords are
+    written to a copy of ``header``, so the caller's header is never touched
+    from the worker thread.
+
+    Returns a Future resolving to imprint_fits_header()'s return code; pass it
+    to take_exposure(header_future=...).  Only use this while a previous
+    exposure is in flight if the controller snapshots header keywords when an
+    exposure starts, otherwise the in-flight image picks up the new values.
+    """
+    next_header = FitsHeader(OrderedDict(header.words))
+    _update_field_header(field, next_header, sequence, None)
+    return _submit("camera-header", imprint_fits_header, next_header)
+
+
 def take_exposure(
     field: Field,
     header: FitsHeader,
@@ -677,35 +1021,46 @@ def take_exposure(
     exp_mode: str = EXP_MODE_SINGLE,
     wait_for_readout: bool = True,
     host: Optional[str] = None,
+    header_future: Optional[Future] = None,
 ) -> ExposureResult:
-    """High-level exposure routine that mirrors the C implementation."""
-    global readout_pending, _t_exp_start_monotonic
+    """High-level exposure routine that mirrors the C implementation.
+
+    If ``header_future`` comes from prepare_next_header() for this field,
+    only the ``flatfile`` keyword is sent here; the rest of the header was
+    imprinted in the background.
+    """
+    global readout_pending, _readout_future, _t_exp_start_monotonic
 
     actual_exposure_hours = exposure_override_hours if exposure_override_hours > 0 else field.expt
-    exposure_seconds = actual_exposure_hours * 3600.0
+    exposure_seconds = actual_exposure_hours * _HR_TO_SEC
 
     timestamp, ut_hours = get_tm()
     jd = get_jd()
 
-    _, field_description = get_shutter_string(field.shutter)
     filename = get_filename(timestamp, field.shutter)
 
     _log_verbose(
-        f"take_exposure: exposing {exposure_seconds:7.1f} sec shutter={field.shutter} "
-        f"filename={filename} mode={exp_mode} wait={wait_for_readout}"
+        "take_exposure: exposing %7.1f sec shutter=%d filename=%s mode=%s wait=%s",
+        exposure_seconds,
+        field.shutter,
+        filename,
+        exp_mode,
+        wait_for_readout,
     )
 
-    header.update("sequence", str(field.n_done + 1))
-    header.update("imagetyp", field_description)
-    header.update("flatfile", filename)
-
-    comment = "no comment"
-    if "#" in field.script_line:
-        comment = field.script_line.split("#", 1)[1].strip()
-    header.update("comment", f"'{comment}'")
-
-    if imprint_fits_header(header) != 0:
-        raise RuntimeError("take_exposure: imprint_fits_header failed")
+    if header_future is None:
+        _update_field_header(field, header, field.n_done + 1, filename)
+        if imprint_fits_header(header) != 0:
+            raise RuntimeError("take_exposure: imprint_fits_header failed")
+    else:
+        if header_future.result() != 0:
+            raise RuntimeError("take_exposure: imprint_fits_header failed")
+        header.update("flatfile", filename)
+        rc, reply = do_camera_command(
+            f"{HEADER_COMMAND} flatfile {filename}", CAMERA_TIMEOUT_SEC, _next_command_id(), host or _host_name
+        )
+        if rc != 0:
+            raise RuntimeError(f"take_exposure: unable to set flatfile header: {reply}")
 
     shutter_state = "True" if field.shutter else "False"
     timeout_sec = expose_timeout(exp_mode, exposure_seconds, wait_for_readout)
@@ -719,25 +1074,9 @@ def take_exposure(
 
     if not wait_for_readout:
         readout_pending = True
-        reply_holder = [""]
-        result_holder = [0]
-        args = _DoCommandArgs(
-            command=command,
-            timeout=timeout_sec,
-            start_semaphore=command_start_semaphore,
-            done_semaphore=command_done_semaphore,
-            command_id=_next_command_id(),
-            reply_holder=reply_holder,
-            result_holder=result_holder,
-        )
-        thread = threading.Thread(
-            target=do_camera_command_thread,
-            args=(args,),
-            name=f"camera-command-{args.command_id}",
-            daemon=True,
+        _readout_future = _submit(
+            "camera-command", do_camera_command, command, timeout_sec, _next_command_id(), host_name
         )
-        thread.start()
-        command_start_semaphore.release()
         _t_exp_start_monotonic = time.monotonic()
         actual_wait = wait_exp_done(exposure_seconds)
         if actual_wait < 0:
@@ -8,14 +8,18 @@ commands and read replies.
 Converted from scheduler_telescope.c
 """
 
+import re
 import socket
 import time
 import os
 import sys
-import subprocess
-from datetime import datetime, timezone
-from typing import Optional, Tuple
-from dataclasses import dataclass
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import BinaryIO, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field as dataclass_field
+
+import numpy as np
 
 
 # Port definitions
@@ -48,6 +52,31 @@ STOPMOUNT_COMMAND = "stopmount"
 STOP_COMMAND = "stop"
 SET_TRACKING_COMMAND = "settracking"
 
+# Settling time after commands that move hardware; queries need none
+POST_COMMAND_DELAY = {
+    SETFOCUS_COMMAND: COMMAND_WAIT_TIME,
+    TRACK_COMMAND: COMMAND_WAIT_TIME,
+    POINT_COMMAND: COMMAND_WAIT_TIME,
+    SET_TRACKING_COMMAND: COMMAND_WAIT_TIME,
+    STOW_COMMAND: COMMAND_WAIT_TIME,
+    STOP_COMMAND: COMMAND_WAIT_TIME,
+    STOPMOUNT_COMMAND: COMMAND_WAIT_TIME,
+    OPENDOME_COMMAND: COMMAND_WAIT_TIME,
+    CLOSEDOME_COMMAND: COMMAND_WAIT_TIME,
+    SLAVEDOME_COMMAND: COMMAND_WAIT_TIME,
+    FILTER_COMMAND: COMMAND_WAIT_TIME,
+}
+
+# Wire form of the argument-less commands, encoded once
+_ENCODED_COMMANDS = {c: (c + "\n").encode() for c in (
+    LST_COMMAND, OPENDOME_COMMAND, CLOSEDOME_COMMAND, GETFOCUS_COMMAND, SLAVEDOME_COMMAND,
+    DOMESTATUS_COMMAND, STATUS_COMMAND, WEATHER_COMMAND, FILTER_COMMAND, POSRD_COMMAND,
+    STOW_COMMAND, STOPMOUNT_COMMAND, STOP_COMMAND)}
+
+# Queries issued by update_telescope_status, in reply order
+STATUS_COMMANDS = (DOMESTATUS_COMMAND, LST_COMMAND, GETFOCUS_COMMAND,
+                   POSRD_COMMAND, WEATHER_COMMAND)
+
 # Filter definitions
 RG610_FILTER = "RG610"
 ZZIR_FILTER = "zzir"
@@ -80,11 +109,15 @@ DEC_OFFSET_MAX = 1.00   # maximum DEC pointing offset (deg)
 
 # Configuration flags
 USE_TELESCOPE_OFFSETS = True
+PERSISTENT_CONNECTIONS = False  # Reuse controller connections (controller must newline/NUL-terminate replies)
+PIPELINE_STATUS_COMMANDS = False  # Send status queries in one batch (controller must accept pipelining and terminate replies)
+PIPELINE_FOCUS_COMMANDS = False  # Send each setfocus together with its getfocus check (same requirements)
 FAKE_RUN = False
 UT_OFFSET = 0.0  # Hours offset for debugging
 
 # Buffer sizes
 MAXBUFSIZE = 4096
+READ_BUFFER_SIZE = 8192  # Buffered reader size for controller replies
 STR_BUF_LEN = 1024
 FILENAME_LENGTH = 256  # Should be defined elsewhere
 
@@ -95,6 +128,28 @@ stop_flag = False
 stow_flag = False
 host_name = "localhost"  # Default, should be set properly
 
+# Open controller connections (socket, buffered reader) keyed by (host, port)
+_conn_cache: Dict[Tuple[str, int], Tuple[socket.socket, BinaryIO]] = {}
+# Serializes request/reply exchanges on the cached connections
+_conn_lock = threading.RLock()
+_status_executor: Optional[ThreadPoolExecutor] = None
+
+# (epoch second, UT_OFFSET) -> Julian Date from the last get_jd call
+_jd_cache: Tuple[Tuple[int, float], float] = ((0, 0.0), 0.0)
+
+# Reply parsers: "ok <lst>", "ok <ra> <dec>", "ok ... : temp : humid : wind sp : wind dir : dew pt"
+_LST_RE = re.compile(r"\s*\S+\s+(\S+)")
+_POSRD_RE = re.compile(r"\s*\S+\s+(\S+)\s+(\S+)")
+_WEATHER_RE = re.compile(r"[^:]*" + r"(?::([^:]*))?" * 5)
+_WEATHER_FIELDS = ("temperature", "humidity", "wind_speed", "wind_direction", "dew_point")
+
+# Parsed file contents keyed by path, valid while (st_mtime_ns, st_size) is unchanged
+_offsets_cache: Dict[str, Tuple[int, int, float, float]] = {}
+_median_focus_cache: Dict[str, Tuple[int, int, float]] = {}
+
+# Focus script output lines look like "... best focus: 50.123 ..."
+_BEST_FOCUS_RE = r"best focus:\s+([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)"
+
 
 @dataclass
 class WeatherInfo:
@@ -130,7 +185,41 @@ class Field:
     """Field information structure"""
     field_number: int = 0
     n_done: int = 0
-    filename: str = ""
+    filenames: List[str] = dataclass_field(default_factory=list)
+
+
+def _read_offsets_file(filename: str) -> Optional[Tuple[float, float]]:
+    """
+    Read RA and Dec offsets from the first line of an offsets file
+    
+    The parsed values are cached and reused until the file's mtime or
+    size changes.
+    
+    Args:
+        filename: Path to offsets file
+        
+    Returns:
+        Tuple of (ra_offset, dec_offset), or None if the line has too few values
+        
+    Raises:
+        IOError: If the file cannot be read
+        ValueError: If the offsets are not numbers
+    """
+    st = os.stat(filename)
+    cached = _offsets_cache.get(filename)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2], cached[3]
+    
+    with open(filename, 'r') as f:
+        line = f.readline()
+    parts = line.strip().split()
+    if len(parts) < 2:
+        return None
+    
+    ra_offset = float(parts[0])
+    dec_offset = float(parts[1])
+    _offsets_cache[filename] = (st.st_mtime_ns, st.st_size, ra_offset, dec_offset)
+    return ra_offset, dec_offset
 
 
 def init_telescope_offsets(status: TelescopeStatus) -> int:
@@ -149,27 +238,20 @@ def init_telescope_offsets(status: TelescopeStatus) -> int:
     
     if verbose:
         print("init_telescope_offsets: Reading default offsets", file=sys.stderr)
-        sys.stderr.flush()
     
     if USE_TELESCOPE_OFFSETS:
         try:
-            with open(TELESCOPE_OFFSETS_FILE, 'r') as f:
-                line = f.readline()
-                parts = line.strip().split()
-                if len(parts) >= 2:
-                    prev_ra_offset = float(parts[0])
-                    prev_dec_offset = float(parts[1])
-                else:
-                    print("init_telescope_offsets: can't read previous offsets", file=sys.stderr)
-                    sys.stderr.flush()
-                    return -1
+            offsets = _read_offsets_file(TELESCOPE_OFFSETS_FILE)
+            if offsets is not None:
+                prev_ra_offset, prev_dec_offset = offsets
+            else:
+                print("init_telescope_offsets: can't read previous offsets", file=sys.stderr)
+                return -1
         except (IOError, ValueError) as e:
             print(f"init_telescope_offsets: can't open file {TELESCOPE_OFFSETS_FILE}", file=sys.stderr)
-            sys.stderr.flush()
             return -1
     else:
         print("init_telescope_offsets: ignoring offsets file, assuming 0 offsets", file=sys.stderr)
-        sys.stderr.flush()
         prev_ra_offset = 0.0
         prev_dec_offset = 0.0
     
@@ -177,8 +259,8 @@ def init_telescope_offsets(status: TelescopeStatus) -> int:
         print(f"init_telescope_offsets: previous offsets are {prev_ra_offset:8.6f} {prev_dec_offset:8.6f}", 
               file=sys.stderr)
     
-    if (prev_ra_offset < RA_OFFSET_MIN or prev_ra_offset > RA_OFFSET_MAX or
-        prev_dec_offset < DEC_OFFSET_MIN or prev_dec_offset > DEC_OFFSET_MAX):
+    if not (RA_OFFSET_MIN <= prev_ra_offset <= RA_OFFSET_MAX and
+            DEC_OFFSET_MIN <= prev_dec_offset <= DEC_OFFSET_MAX):
         print("init_telescope_offset: previous offsets out of range.", file=sys.stderr)
         return -1
     
@@ -194,7 +276,7 @@ def get_telescope_offsets(field: Field, status: TelescopeStatus) -> int:
     Use system call to OFFSET_PROGRAM to determine offsets to telescope pointing
     
     Args:
-        field: Field object with filename
+        field: Field object with the exposure filenames (the last one is measured)
         status: TelescopeStatus object to update
         
     Returns:
@@ -202,60 +284,59 @@ def get_telescope_offsets(field: Field, status: TelescopeStatus) -> int:
     """
     if verbose:
         print("get_telescope_offsets: initialize offsets from stored values", file=sys.stderr)
-        sys.stderr.flush()
     
     if init_telescope_offsets(status) != 0:
         print("get_telescope_offsets: problem reading stored offsets. Using defaults", file=sys.stderr)
-        sys.stderr.flush()
     
     if verbose:
         print(f"get_telescope_offsets: initializing default offsets to {status.ra_offset:8.6f} {status.dec_offset:8.6f}",
               file=sys.stderr)
-        sys.stderr.flush()
     
-    # Form system command for offset script
-    command_string = f"{OFFSET_SCRIPT} {field.filename}\n"
+    # Form argv for offset script (run directly, no shell)
+    argv = [os.path.expanduser(OFFSET_SCRIPT), field.filenames[-1] if field.filenames else ""]
     
     if verbose:
-        print(f"get_telescope_offsets: {command_string}", file=sys.stderr)
-        sys.stderr.flush()
+        print(f"get_telescope_offsets: {' '.join(argv)}", file=sys.stderr)
     
     if not FAKE_RUN:
         # Run offset script
-        result = subprocess.run(command_string, shell=True, capture_output=True)
-        if result.returncode != 0:
+        import subprocess  # deferred: only needed when a script is actually run
+        try:
+            # Absolute executable and close_fds=False (our sockets are non-inheritable)
+            # let subprocess launch via posix_spawn instead of fork+exec
+            # Results come back through files, so script output is discarded
+            returncode = subprocess.run(argv, executable=argv[0], close_fds=False,
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                        check=False).returncode
+        except OSError as e:
+            print(f"get_telescope_offsets: can't run {argv[0]}: {e}", file=sys.stderr)
+            returncode = -1
+        if returncode != 0:
             print("get_telescope_offsets: system command unsuccessful", file=sys.stderr)
             print(f"get_telescope_offsets: Assuming default offset values {status.ra_offset:8.6f} {status.dec_offset:8.6f}",
                   file=sys.stderr)
-            sys.stderr.flush()
             return -1
         
         if verbose:
             print("get_telescope_offsets: Reading new offsets", file=sys.stderr)
-            sys.stderr.flush()
         
         # Reopen TELESCOPE_OFFSETS_FILE
         try:
-            with open(TELESCOPE_OFFSETS_FILE, 'r') as f:
-                line = f.readline()
-                parts = line.strip().split()
-                if len(parts) >= 2:
-                    ra_offset = float(parts[0])
-                    dec_offset = float(parts[1])
-                else:
-                    print("get_telescope_offsets: can't read new offsets", file=sys.stderr)
-                    sys.stderr.flush()
-                    return -1
+            offsets = _read_offsets_file(TELESCOPE_OFFSETS_FILE)
+            if offsets is not None:
+                ra_offset, dec_offset = offsets
+            else:
+                print("get_telescope_offsets: can't read new offsets", file=sys.stderr)
+                return -1
         except (IOError, ValueError) as e:
             print(f"get_telescope_offsets: can't open file {TELESCOPE_OFFSETS_FILE}", file=sys.stderr)
-            sys.stderr.flush()
             return -1
         
         if verbose:
             print(f"get_telescope_offsets: new offsets are {ra_offset:8.6f} {dec_offset:8.6f}", file=sys.stderr)
         
-        if (ra_offset < RA_OFFSET_MIN or ra_offset > RA_OFFSET_MAX or
-            dec_offset < DEC_OFFSET_MIN or dec_offset > DEC_OFFSET_MAX):
+        if not (RA_OFFSET_MIN <= ra_offset <= RA_OFFSET_MAX and
+                DEC_OFFSET_MIN <= dec_offset <= DEC_OFFSET_MAX):
             print(f"get_telescope_offset: new offsets out of range. Substituting default values {status.ra_offset:8.5f} {status.dec_offset:8.5f}",
                   file=sys.stderr)
             return -1
@@ -265,7 +346,6 @@ def get_telescope_offsets(field: Field, status: TelescopeStatus) -> int:
     
     print(f"get_telescope_offset: setting telescope offsets to {status.ra_offset:8.5f} {status.dec_offset:8.5f}",
           file=sys.stderr)
-    sys.stderr.flush()
     
     return 0
 
@@ -281,52 +361,30 @@ def get_median_focus(filename: str) -> float:
         Median focus value, or -1.0 on error
     """
     try:
-        with open(filename, 'r') as f:
-            lines = f.readlines()
+        st = os.stat(filename)
+        cached = _median_focus_cache.get(filename)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        focus_values = np.fromregex(filename, _BEST_FOCUS_RE, dtype=[('focus', np.float64)])['focus']
     except IOError:
         print(f"get_median_focus: could not open file {filename}", file=sys.stderr)
-        sys.stderr.flush()
         return -1.0
     
-    focus_values = []
-    for line in lines:
-        if "best focus:" in line:
-            parts = line.split()
-            try:
-                # Find the value after "best focus:"
-                idx = parts.index("focus:") + 1
-                if idx < len(parts):
-                    value = float(parts[idx])
-                    focus_values.append(value)
-                    if verbose:
-                        print(f"get_median_focus: value {len(focus_values)} is {value:8.5f}", file=sys.stderr)
-                        sys.stderr.flush()
-            except (ValueError, IndexError):
-                continue
-            
-            if len(focus_values) >= 20:
-                print("get_median_focus: too many focus values", file=sys.stderr)
-                return -1.0
-    
-    if len(focus_values) == 0:
-        print("get_median_focus: no focus values", file=sys.stderr)
-        sys.stderr.flush()
-        return -1.0
+    if verbose:
+        for i, value in enumerate(focus_values[:20]):
+            print(f"get_median_focus: value {i + 1} is {value:8.5f}", file=sys.stderr)
     
-    if len(focus_values) == 1:
-        return focus_values[0]
+    if focus_values.size >= 20:
+        print("get_median_focus: too many focus values", file=sys.stderr)
+        return -1.0
     
-    if len(focus_values) == 2:
-        return (focus_values[0] + focus_values[1]) / 2.0
+    if focus_values.size == 0:
+        print("get_median_focus: no focus values", file=sys.stderr)
+        return -1.0
     
-    # Sort values and find median
-    focus_values.sort()
-    n = len(focus_values)
-    if n % 2 == 0:
-        median = (focus_values[n//2 - 1] + focus_values[n//2]) / 2.0
-    else:
-        median = focus_values[n//2]
+    median = float(np.median(focus_values))
     
+    _median_focus_cache[filename] = (st.st_mtime_ns, st.st_size, median)
     return median
 
 
@@ -344,48 +402,45 @@ def focus_telescope(field: Field, status: TelescopeStatus, focus_default: float)
     """
     if verbose:
         print(f"focus_telescope: Field {field.field_number}, n_done {field.n_done}", file=sys.stderr)
-        sys.stderr.flush()
     
-    # Form system command for focus script
-    command_parts = [FOCUS_SCRIPT]
-    for i in range(field.n_done):
-        # Extract filename from field.filename at position i*FILENAME_LENGTH
-        start_idx = i * FILENAME_LENGTH
-        end_idx = start_idx + FILENAME_LENGTH
-        fname = field.filename[start_idx:end_idx].rstrip('\0')
-        command_parts.append(fname)
-    
-    command_string = ' '.join(command_parts) + '\n'
+    # Form argv for focus script (run directly, no shell)
+    argv = [os.path.expanduser(FOCUS_SCRIPT), *field.filenames[:field.n_done]]
     
     if verbose:
-        print(f"focus_telescope: {command_string}", file=sys.stderr)
-        sys.stderr.flush()
+        print(f"focus_telescope: {' '.join(argv)}", file=sys.stderr)
     
     if FAKE_RUN:
         status.focus = focus_default
     else:
         # Run focus script
-        result = subprocess.run(command_string, shell=True, capture_output=True)
-        if result.returncode != 0:
+        import subprocess  # deferred: only needed when a script is actually run
+        try:
+            # Absolute executable and close_fds=False (our sockets are non-inheritable)
+            # let subprocess launch via posix_spawn instead of fork+exec
+            # Results come back through files, so script output is discarded
+            returncode = subprocess.run(argv, executable=argv[0], close_fds=False,
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                        check=False).returncode
+        except OSError as e:
+            print(f"focus_telescope: can't run {argv[0]}: {e}", file=sys.stderr)
+            returncode = -1
+        if returncode != 0:
             print("focus_telescope: system command unsuccessful", file=sys.stderr)
-            sys.stderr.flush()
         
         median = get_median_focus(FOCUS_OUTPUT_FILE)
-        if median <= 0:
+        focus_ok = (median > 0 and MIN_FOCUS <= median <= MAX_FOCUS and
+                    abs(median - focus_default) <= MAX_FOCUS_CHANGE)
+        focus = median if focus_ok else focus_default
+        if focus_ok:
+            print(f"focus_telescope: best focus is {focus:8.5f} mm", file=sys.stderr)
+        elif median <= 0:
             print("focus_telescope: could not get focus", file=sys.stderr)
-            focus = focus_default
-        elif median < MIN_FOCUS or median > MAX_FOCUS:
+        elif not MIN_FOCUS <= median <= MAX_FOCUS:
             print(f"focus_telescope: median out of range: {median:8.5f}", file=sys.stderr)
-            focus = focus_default
-        elif abs(median - focus_default) > MAX_FOCUS_CHANGE:
-            print(f"focus_telescope: unexpected change of focus: {median:8.5f}", file=sys.stderr)
-            focus = focus_default
         else:
-            focus = median
-            print(f"focus_telescope: best focus is {focus:8.5f} mm", file=sys.stderr)
+            print(f"focus_telescope: unexpected change of focus: {median:8.5f}", file=sys.stderr)
         
         print(f"focus_telescope: setting focus to {focus:8.5f} mm", file=sys.stderr)
-        sys.stderr.flush()
         
         if set_telescope_focus(focus) != 0:
             print("focus_telescope: could not set telescope focus", file=sys.stderr)
@@ -393,7 +448,6 @@ def focus_telescope(field: Field, status: TelescopeStatus, focus_default: float)
         
         if verbose:
             print("focus_telescope: updating telescope status", file=sys.stderr)
-            sys.stderr.flush()
         
         if update_telescope_status(status) != 0:
             print("focus_telescope: could not update telescope status", file=sys.stderr)
@@ -415,7 +469,6 @@ def stow_telescope() -> int:
     
     if verbose:
         print("stow_telescope: stowing telescope", file=sys.stderr)
-        sys.stderr.flush()
     
     command = STOW_COMMAND
     reply = do_telescope_command(command, TELESCOPE_POINT_TIMEOUT_SEC, host_name)
@@ -445,20 +498,35 @@ def get_telescope_focus() -> Tuple[int, float]:
     
     if reply is None:
         print("get_telescope_focus: error getting focus", file=sys.stderr)
-        sys.stderr.flush()
         return -1, focus
-    elif TEL_DONE_REPLY in reply:
+    
+    value = _parse_focus_reply(reply)
+    if value is not None:
+        return 0, value
+    
+    print("get_telescope_focus: bad reply from telescope", file=sys.stderr)
+    print(f"get_telescope_focus: reply: {reply}", file=sys.stderr)
+    return -1, focus
+
+
+def _parse_focus_reply(reply: str) -> Optional[float]:
+    """
+    Parse the focus value from a getfocus reply
+    
+    Args:
+        reply: Reply string from the controller
+        
+    Returns:
+        Focus value, or None if the reply is not a valid focus reply
+    """
+    if TEL_DONE_REPLY in reply:
         parts = reply.split()
         if len(parts) >= 2:
             try:
-                focus = float(parts[1])
-                return 0, focus
+                return float(parts[1])
             except ValueError:
                 pass
-    
-    print("get_telescope_focus: bad reply from telescope", file=sys.stderr)
-    print(f"get_telescope_focus: reply: {reply}", file=sys.stderr)
-    return -1, focus
+    return None
 
 
 def set_telescope_focus(focus: float) -> int:
@@ -488,10 +556,10 @@ def set_telescope_focus(focus: float) -> int:
         focus1 = focus1 + MAX_FOCUS_DEVIATION
         if verbose:
             print(f"set_telescope_focus: advancing focus to {focus1:8.5f} before a decrement", file=sys.stderr)
-            sys.stderr.flush()
         
         command = f"{SETFOCUS_COMMAND} {focus1:9.5f}"
-        reply = do_telescope_command(command, TELESCOPE_FOCUS_TIMEOUT_SEC, host_name)
+        reply, focus_reply = do_telescope_command_pair(command, GETFOCUS_COMMAND,
+                                                       TELESCOPE_FOCUS_TIMEOUT_SEC, host_name)
         
         if reply is None:
             print(f"set_telescope_focus: setfocus reply error: reply : {reply}", file=sys.stderr)
@@ -499,8 +567,8 @@ def set_telescope_focus(focus: float) -> int:
         elif verbose:
             print("set_telescope_focus: setfocus successful", file=sys.stderr)
         
-        status, focus1 = get_telescope_focus()
-        if status != 0:
+        focus1 = None if focus_reply is None else _parse_focus_reply(focus_reply)
+        if focus1 is None:
             print("set_telescope_focus: error reading resulting focus", file=sys.stderr)
             return -1
         elif verbose:
@@ -509,15 +577,14 @@ def set_telescope_focus(focus: float) -> int:
     # Now go to desired focus, repeat NUM_FOCUS_ITERATIONS times
     if verbose:
         print(f"set_telescope_focus: now setting to target focus {focus:8.5f}", file=sys.stderr)
-        sys.stderr.flush()
     
     for i in range(1, NUM_FOCUS_ITERATIONS + 1):
         if verbose and i > 1:
             print("set_telescope_focus: setting to target focus again", file=sys.stderr)
-            sys.stderr.flush()
         
         command = f"{SETFOCUS_COMMAND} {focus:9.5f}"
-        reply = do_telescope_command(command, TELESCOPE_FOCUS_TIMEOUT_SEC, host_name)
+        reply, focus_reply = do_telescope_command_pair(command, GETFOCUS_COMMAND,
+                                                       TELESCOPE_FOCUS_TIMEOUT_SEC, host_name)
         
         if reply is None:
             print(f"set_telescope_focus: setfocus reply error: reply : {reply}", file=sys.stderr)
@@ -525,8 +592,8 @@ def set_telescope_focus(focus: float) -> int:
         elif verbose:
             print("set_telescope_focus: command successful", file=sys.stderr)
         
-        status, focus1 = get_telescope_focus()
-        if status != 0:
+        focus1 = None if focus_reply is None else _parse_focus_reply(focus_reply)
+        if focus1 is None:
             print("set_telescope_focus: error reading resulting focus", file=sys.stderr)
             return -1
         elif verbose:
@@ -535,7 +602,6 @@ def set_telescope_focus(focus: float) -> int:
     if abs(focus1 - focus) > MAX_FOCUS_DEVIATION:
         print(f"set_telescope_focus: unable to set focus to {focus:8.5f}. Current focus is {focus1:8.5f}",
               file=sys.stderr)
-        sys.stderr.flush()
         return -1
     
     return 0
@@ -552,7 +618,6 @@ def stop_telescope() -> int:
     
     if verbose:
         print("stop_telescope: stopping telescope", file=sys.stderr)
-        sys.stderr.flush()
     
     command = STOP_COMMAND
     reply = do_telescope_command(command, TELESCOPE_POINT_TIMEOUT_SEC, host_name)
@@ -624,11 +689,12 @@ def update_telescope_status(status: TelescopeStatus) -> int:
     """
     status.ut = get_ut()
     
+    dome_reply, lst_reply, focus_reply, pos_reply, weather_reply = _get_status_replies()
+    
     # Get dome status
-    reply = do_telescope_command(DOMESTATUS_COMMAND, TELESCOPE_COMMAND_TIMEOUT, host_name)
+    reply = dome_reply
     if reply is None:
         print("update_telescope_status: error getting domestatus", file=sys.stderr)
-        sys.stderr.flush()
         return -1
     elif TEL_DONE_REPLY in reply:
         if "open" in reply:
@@ -637,24 +703,22 @@ def update_telescope_status(status: TelescopeStatus) -> int:
             status.dome_status = 0
     
     # Get LST
-    reply = do_telescope_command(LST_COMMAND, TELESCOPE_COMMAND_TIMEOUT, host_name)
+    reply = lst_reply
     if reply is None:
         print("update_telescope_status: error getting lst", file=sys.stderr)
-        sys.stderr.flush()
         return -1
     elif TEL_DONE_REPLY in reply:
-        parts = reply.split()
-        if len(parts) >= 2:
+        m = _LST_RE.match(reply)
+        if m:
             try:
-                status.lst = float(parts[1])
+                status.lst = float(m.group(1))
             except ValueError:
                 pass
     
     # Get focus
-    result, focus = get_telescope_focus()
-    if result != 0:
+    focus = None if focus_reply is None else _parse_focus_reply(focus_reply)
+    if focus is None:
         print("update_telescope_status: error getting focus", file=sys.stderr)
-        sys.stderr.flush()
         return -1
     status.focus = focus
     
@@ -662,47 +726,85 @@ def update_telescope_status(status: TelescopeStatus) -> int:
     status.filter_string = "UNKNOWN"
     
     # Get position
-    reply = do_telescope_command(POSRD_COMMAND, TELESCOPE_COMMAND_TIMEOUT, host_name)
+    reply = pos_reply
     if reply is None:
         print("update_telescope_status: error getting position", file=sys.stderr)
-        sys.stderr.flush()
         return -1
     elif TEL_DONE_REPLY in reply:
-        parts = reply.split()
-        if len(parts) >= 3:
+        m = _POSRD_RE.match(reply)
+        if m:
             try:
-                status.ra = float(parts[1])
-                status.dec = float(parts[2])
+                status.ra = float(m.group(1))
+                status.dec = float(m.group(2))
             except ValueError:
                 pass
     
     # Get weather
-    reply = do_telescope_command(WEATHER_COMMAND, TELESCOPE_COMMAND_TIMEOUT, host_name)
+    reply = weather_reply
     if reply is None:
         print("update_telescope_status: error getting weather", file=sys.stderr)
-        sys.stderr.flush()
         return -1
     elif TEL_DONE_REPLY in reply:
-        # Parse weather data from reply
+        # Parse weather data from reply; fields missing from the reply are left unchanged
         # Format: ok ... : temperature : humidity : wind_speed : wind_direction : dew_point
-        parts = reply.split(':')
+        w = status.weather
         try:
-            if len(parts) > 1:
-                status.weather.temperature = float(parts[1].strip())
-            if len(parts) > 2:
-                status.weather.humidity = float(parts[2].strip())
-            if len(parts) > 3:
-                status.weather.wind_speed = float(parts[3].strip())
-            if len(parts) > 4:
-                status.weather.wind_direction = float(parts[4].strip())
-            if len(parts) > 5:
-                status.weather.dew_point = float(parts[5].strip())
+            for name, value in zip(_WEATHER_FIELDS, _WEATHER_RE.match(reply).groups()):
+                if value is None:
+                    break
+                setattr(w, name, float(value))
         except ValueError:
             pass
     
     return 0
 
 
+def update_telescope_status_async(status: TelescopeStatus) -> Future:
+    """
+    Refresh telescope status in the background
+    
+    Lets the caller overlap the status round trips with other work (e.g. a
+    camera readout). The status queries hold the connection lock together,
+    so commands from other threads wait until the whole refresh is done;
+    don't read status until the future is done.
+    
+    Args:
+        status: TelescopeStatus object to update
+        
+    Returns:
+        Future resolving to update_telescope_status()'s return code
+    """
+    global _status_executor
+    if _status_executor is None:
+        _status_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="telescope-status")
+    return _status_executor.submit(update_telescope_status, status)
+
+
+def _get_status_replies() -> List[Optional[str]]:
+    """
+    Query the controller for everything update_telescope_status needs
+    
+    With PIPELINE_STATUS_COMMANDS the queries go out in a single batch;
+    otherwise they are sent one at a time, stopping at the first failure.
+    
+    The connection lock (re-entrant) is held across all the queries, so
+    commands from other threads cannot interleave with a refresh.
+    
+    Returns:
+        One reply per entry in STATUS_COMMANDS (None where a query failed or was not sent)
+    """
+    with _conn_lock:
+        if PIPELINE_STATUS_COMMANDS:
+            return do_telescope_commands(list(STATUS_COMMANDS), TELESCOPE_COMMAND_TIMEOUT, host_name)
+        
+        replies: List[Optional[str]] = [None] * len(STATUS_COMMANDS)
+        for i, command in enumerate(STATUS_COMMANDS):
+            replies[i] = do_telescope_command(command, TELESCOPE_COMMAND_TIMEOUT, host_name)
+            if replies[i] is None:
+                break
+        return replies
+
+
 def print_telescope_status(status: TelescopeStatus, output=sys.stdout):
     """
     Print telescope status
@@ -712,29 +814,155 @@ def print_telescope_status(status: TelescopeStatus, output=sys.stdout):
         output: Output file object
     """
     w = status.weather
+    dome = "open" if status.dome_status == 1 else "closed"
+    
+    output.write(f"UT    : {status.ut:10.6f}  "
+                 f"LST   : {status.lst:10.6f}  "
+                 f"RA    : {status.ra:10.6f}  "
+                 f"Dec   : {status.dec:10.6f}  "
+                 f"dome  : {dome}  "
+                 f"Focus : {status.focus:7.3f}  "
+                 f"Filter: {status.filter_string}  "
+                 f"Temp  : {w.temperature:5.1f}  "
+                 f"Humid : {w.humidity:5.1f}  "
+                 f"Wnd Sp: {w.wind_speed:5.1f}  "
+                 f"Wnd Dr: {w.wind_direction:5.1f}\n")
+
+
+def _open_connection(host: str, port: int, timeout: int) -> Tuple[socket.socket, BinaryIO]:
+    """
+    Open a controller connection with keepalive and Nagle disabled
     
-    print(f"UT    : {status.ut:10.6f}  ", end='', file=output)
-    print(f"LST   : {status.lst:10.6f}  ", end='', file=output)
-    print(f"RA    : {status.ra:10.6f}  ", end='', file=output)
-    print(f"Dec   : {status.dec:10.6f}  ", end='', file=output)
+    Args:
+        host: Hostname or IP address
+        port: Port number
+        timeout: Timeout in seconds
+        
+    Returns:
+        Tuple of (connected socket, buffered reader on the socket)
+    """
+    sock = socket.create_connection((host, port), timeout=timeout)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    return sock, sock.makefile('rb', buffering=READ_BUFFER_SIZE)
+
+
+def _get_connection(host: str, port: int, timeout: int) -> Tuple[socket.socket, BinaryIO, bool]:
+    """
+    Get the cached connection for (host, port), opening one if needed
     
-    if status.dome_status == 1:
-        print("dome  : open  ", end='', file=output)
-    else:
-        print("dome  : closed  ", end='', file=output)
+    Args:
+        host: Hostname or IP address
+        port: Port number
+        timeout: Timeout in seconds
+        
+    Returns:
+        Tuple of (socket, buffered reader, True if the connection was reused)
+    """
+    key = (host, port)
+    conn = _conn_cache.get(key)
+    reused = conn is not None
+    if conn is None:
+        conn = _open_connection(host, port, timeout)
+        _conn_cache[key] = conn
+    sock, rfile = conn
+    sock.settimeout(timeout)
+    return sock, rfile, reused
+
+
+def _drop_connection(key: Tuple[str, int]):
+    """
+    Close and forget a cached controller connection
+    
+    Args:
+        key: (host, port) of the connection
+    """
+    conn = _conn_cache.pop(key, None)
+    if conn is not None:
+        for f in (conn[1], conn[0]):
+            try:
+                f.close()
+            except OSError:
+                pass
+
+
+def close_telescope_connections():
+    """
+    Close all cached controller connections (call at shutdown)
+    """
+    for key in list(_conn_cache):
+        _drop_connection(key)
+
+
+def _read_reply(sock: socket.socket, rfile: BinaryIO, timeout: float) -> Tuple[bytes, bool]:
+    """
+    Read one reply, terminated by newline or NUL
+    
+    Only used with PERSISTENT_CONNECTIONS or the PIPELINE_* flags, where
+    replies share a connection and must be framed; a controller that does
+    not terminate its replies makes this wait for the full timeout.
+    Bytes after the terminator stay in the reader's buffer for the next
+    reply, and empty frames (e.g. a NUL following a newline) are skipped.
+    The timeout bounds the whole reply, not each recv, so a controller
+    trickling partial data cannot stretch the wait past it.
+    
+    Args:
+        sock: Connected socket
+        rfile: Buffered reader on the connection
+        timeout: Seconds allowed for the complete reply
+        
+    Returns:
+        Tuple of (reply bytes, True if terminated rather than cut off by the peer closing)
+        
+    Raises:
+        socket.timeout: If the reply is not complete within timeout
+    """
+    deadline = time.monotonic() + timeout
+    buf = bytearray()
+    while len(buf) < MAXBUFSIZE:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise socket.timeout("timed out waiting for reply")
+        sock.settimeout(remaining)
+        data = rfile.peek(MAXBUFSIZE)
+        if not data:
+            return bytes(buf), False
+        ends = [i for i in (data.find(b"\n"), data.find(b"\0")) if i >= 0]
+        if not ends:
+            buf += rfile.read(len(data))
+            continue
+        buf += rfile.read(min(ends) + 1)[:-1]
+        if buf:
+            return bytes(buf), True
+    return bytes(buf), True
+
+
+def _encode_command(command: str) -> bytes:
+    """
+    Newline-terminated bytes to send for a command
     
-    print(f"Focus : {status.focus:7.3f}  ", end='', file=output)
-    print(f"Filter: {status.filter_string}  ", end='', file=output)
-    print(f"Temp  : {w.temperature:5.1f}  ", end='', file=output)
-    print(f"Humid : {w.humidity:5.1f}  ", end='', file=output)
-    print(f"Wnd Sp: {w.wind_speed:5.1f}  ", end='', file=output)
-    print(f"Wnd Dr: {w.wind_direction:5.1f}", file=output)
+    Args:
+        command: Command string
+        
+    Returns:
+        Encoded command
+    """
+    data = _ENCODED_COMMANDS.get(command)
+    if data is None:
+        data = (command if command.endswith('\n') else command + '\n').encode()
+    return data
 
 
 def send_command(command: str, host: str, port: int, timeout: int) -> Optional[str]:
     """
     Send command to telescope controller via socket
     
+    By default each command gets a fresh connection and the reply is what
+    the first recv delivers, as in read_data() in socket.c. With
+    PERSISTENT_CONNECTIONS, connections are cached per (host, port) and
+    reused; a cached connection that the controller has closed is reopened
+    and the command resent once.
+    
     Args:
         command: Command string to send
         host: Hostname or IP address
@@ -744,32 +972,118 @@ def send_command(command: str, host: str, port: int, timeout: int) -> Optional[s
     Returns:
         Reply string on success, None on failure
     """
-    try:
-        # Create socket
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
+    with _conn_lock:
+        data = _encode_command(command)
+        if not PERSISTENT_CONNECTIONS:
+            try:
+                with socket.create_connection((host, port), timeout=timeout) as sock:
+                    sock.sendall(data)
+                    return sock.recv(MAXBUFSIZE).decode().strip()
+            except (socket.error, socket.timeout) as e:
+                print(f"send_command: socket error: {e}", file=sys.stderr)
+                return None
         
-        # Connect to server
-        sock.connect((host, port))
+        key = (host, port)
         
-        # Send command
-        if not command.endswith('\n'):
-            command += '\n'
-        sock.sendall(command.encode())
+        for attempt in range(2):
+            reused = False
+            try:
+                sock, rfile, reused = _get_connection(host, port, timeout)
+                sock.sendall(data)
+                reply, complete = _read_reply(sock, rfile, timeout)
+            except socket.timeout as e:
+                _drop_connection(key)
+                print(f"send_command: socket error: {e}", file=sys.stderr)
+                return None
+            except socket.error as e:
+                _drop_connection(key)
+                if reused and attempt == 0:
+                    continue
+                print(f"send_command: socket error: {e}", file=sys.stderr)
+                return None
         
-        # Receive reply
-        reply = sock.recv(MAXBUFSIZE).decode().strip()
+            if not complete:
+                # Controller closed the connection after (or instead of) replying
+                _drop_connection(key)
+                if not reply and reused and attempt == 0:
+                    continue
         
-        # Close socket
-        sock.close()
+            return reply.decode().strip()
         
-        return reply
-        
-    except (socket.error, socket.timeout) as e:
-        print(f"send_command: socket error: {e}", file=sys.stderr)
         return None
 
 
+def send_commands(commands: List[str], host: str, port: int, timeout: int) -> List[Optional[str]]:
+    """
+    Send several commands in one write and read back one reply per command
+    
+    If the controller closes the connection before answering everything,
+    the unanswered commands are resent one at a time with send_command.
+    
+    Args:
+        commands: Command strings to send
+        host: Hostname or IP address
+        port: Port number
+        timeout: Timeout in seconds
+        
+    Returns:
+        List of reply strings (None where a command failed)
+    """
+    with _conn_lock:
+        data = b"".join(_encode_command(c) for c in commands)
+        key = (host, port)
+        frames: List[bytes] = []
+        
+        for attempt in range(2):
+            reused = False
+            frames = []
+            try:
+                sock, rfile, reused = _get_connection(host, port, timeout)
+                sock.sendall(data)
+                while len(frames) < len(commands):
+                    reply, complete = _read_reply(sock, rfile, timeout)
+                    if reply:
+                        frames.append(reply)
+                    if not complete:
+                        _drop_connection(key)
+                        break
+            except socket.timeout as e:
+                _drop_connection(key)
+                print(f"send_commands: socket error: {e}", file=sys.stderr)
+                return [None] * len(commands)
+            except socket.error as e:
+                _drop_connection(key)
+                if reused and attempt == 0:
+                    continue
+                print(f"send_commands: socket error: {e}", file=sys.stderr)
+                return [None] * len(commands)
+        
+            if frames or not reused:
+                break
+        
+        if not PERSISTENT_CONNECTIONS:
+            _drop_connection(key)
+        
+        replies: List[Optional[str]] = [f.decode().strip() for f in frames]
+        for command in commands[len(replies):]:
+            replies.append(send_command(command, host, port, timeout))
+        return replies
+
+
+def _post_command_delay(command: str) -> float:
+    """
+    Look up how long to let the controller settle after a command
+    
+    Args:
+        command: Command string, possibly with arguments
+        
+    Returns:
+        Delay in seconds (0 for queries)
+    """
+    name = command.split(None, 1)[0] if command.strip() else ""
+    return POST_COMMAND_DELAY.get(name, 0.0)
+
+
 def do_telescope_command(command: str, timeout: int, host: str) -> Optional[str]:
     """
     Execute telescope command
@@ -784,17 +1098,16 @@ def do_telescope_command(command: str, timeout: int, host: str) -> Optional[str]
     """
     if verbose1:
         print(f"do_telescope_command: sending command: {command}", file=sys.stderr)
-        sys.stderr.flush()
     
     reply = send_command(command, host, TEL_COMMAND_PORT, timeout)
     
     if reply is None:
         print(f"do_telescope_command: error sending command {command}", file=sys.stderr)
-        sys.stderr.flush()
         return None
     
-    if COMMAND_WAIT_TIME > 0:
-        time.sleep(COMMAND_WAIT_TIME)
+    delay = _post_command_delay(command)
+    if delay > 0:
+        time.sleep(delay)
     
     if TEL_ERROR_REPLY in reply or len(reply) == 0:
         print(f"do_telescope_command: error reading domestatus : {reply}", file=sys.stderr)
@@ -802,13 +1115,76 @@ def do_telescope_command(command: str, timeout: int, host: str) -> Optional[str]
     elif TEL_DONE_REPLY in reply:
         if verbose1:
             print(f"do_telescope_command: reply was {reply}", file=sys.stderr)
-            sys.stderr.flush()
         return reply
     else:
         print(f"do_telescope_command: bad response from telescope : {reply}", file=sys.stderr)
         return None
 
 
+def do_telescope_commands(commands: List[str], timeout: int, host: str) -> List[Optional[str]]:
+    """
+    Execute several telescope commands in a single pipelined request
+    
+    Args:
+        commands: Commands to execute
+        timeout: Timeout in seconds
+        host: Hostname
+        
+    Returns:
+        List with the reply string for each command, or None where it failed
+    """
+    if verbose1:
+        print(f"do_telescope_commands: sending commands: {' '.join(commands)}", file=sys.stderr)
+    
+    replies = send_commands(commands, host, TEL_COMMAND_PORT, timeout)
+    
+    delay = max(_post_command_delay(c) for c in commands)
+    if delay > 0:
+        time.sleep(delay)
+    
+    for i, (command, reply) in enumerate(zip(commands, replies)):
+        if reply is None:
+            print(f"do_telescope_commands: error sending command {command}", file=sys.stderr)
+        elif TEL_ERROR_REPLY in reply or len(reply) == 0:
+            print(f"do_telescope_commands: error reading {command} : {reply}", file=sys.stderr)
+            replies[i] = None
+        elif TEL_DONE_REPLY in reply:
+            if verbose1:
+                print(f"do_telescope_commands: reply to {command} was {reply}", file=sys.stderr)
+        else:
+            print(f"do_telescope_commands: bad response from telescope : {reply}", file=sys.stderr)
+            replies[i] = None
+    
+    return replies
+
+
+def do_telescope_command_pair(command_a: str, command_b: str, timeout: int,
+                              host: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Execute two telescope commands back to back
+    
+    With PIPELINE_FOCUS_COMMANDS both go out in one request; otherwise they
+    are sent in turn and command_b is skipped if command_a fails.
+    
+    Args:
+        command_a: First command
+        command_b: Second command
+        timeout: Timeout in seconds
+        host: Hostname
+        
+    Returns:
+        Tuple of reply strings (None where a command failed or was not sent)
+    """
+    if PIPELINE_FOCUS_COMMANDS:
+        reply_a, reply_b = do_telescope_commands([command_a, command_b], timeout, host)
+        return reply_a, reply_b
+    
+    reply_a = do_telescope_command(command_a, timeout, host)
+    if reply_a is None:
+        return None, None
+    return reply_a, do_telescope_command(command_b, timeout, host)
+
+
 def do_daytime_telescope_command(command: str, timeout: int, host: str) -> Optional[str]:
     """
     Execute telescope command in daytime mode
@@ -824,17 +1200,16 @@ def do_daytime_telescope_command(command: str, timeout: int, host: str) -> Optio
     """
     if verbose1:
         print(f"do_telescope_command: sending command: {command}", file=sys.stderr)
-        sys.stderr.flush()
     
     reply = send_command(command, host, DAYTIME_TEL_COMMAND_PORT, timeout)
     
     if reply is None:
         print(f"do_telescope_command: error sending command {command}", file=sys.stderr)
-        sys.stderr.flush()
         return None
     
-    if COMMAND_WAIT_TIME > 0:
-        time.sleep(COMMAND_WAIT_TIME)
+    delay = _post_command_delay(command)
+    if delay > 0:
+        time.sleep(delay)
     
     if TEL_ERROR_REPLY in reply or len(reply) == 0:
         print(f"do_telescope_command: error reading domestatus : {reply}", file=sys.stderr)
@@ -842,7 +1217,6 @@ def do_daytime_telescope_command(command: str, timeout: int, host: str) -> Optio
     elif TEL_DONE_REPLY in reply:
         if verbose1:
             print(f"do_telescope_command: reply was {reply}", file=sys.stderr)
-            sys.stderr.flush()
         return reply
     else:
         print(f"do_telescope_command: bad response from telescope : {reply}", file=sys.stderr)
@@ -856,14 +1230,12 @@ def get_ut() -> float:
     Returns:
         UT time in hours
     """
-    now = datetime.now(timezone.utc)
-    ut = now.hour + now.minute / 60.0 + now.second / 3600.0
+    # Epoch seconds are UTC, so hours past midnight come straight from time.time()
+    ut = (time.time() / 3600.0) % 24.0
     
     # Debug offset
     if UT_OFFSET != 0.0:
-        ut = ut + UT_OFFSET
-        if ut > 24.0:
-            ut = ut - 24.0
+        ut = (ut + UT_OFFSET) % 24.0
     
     return ut
 
@@ -884,7 +1256,6 @@ def get_tm() -> Tuple[datetime, float]:
         if ut > 24.0:
             ut = ut - 24.0
             # Advance day
-            from datetime import timedelta
             now = now + timedelta(days=1)
         
         # Adjust time components
@@ -906,13 +1277,7 @@ def leap_year_check(year: int) -> bool:
     Returns:
         True if leap year, False otherwise
     """
-    if year % 4 != 0:
-        return False
-    if year % 100 != 0:
-        return True
-    if year % 400 == 0:
-        return True
-    return False
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
 
 
 def date_to_jd(date_time: datetime) -> float:
@@ -937,15 +1302,51 @@ def date_to_jd(date_time: datetime) -> float:
     return jd
 
 
+def date_to_jd_batch(years: np.ndarray, months: np.ndarray, days: np.ndarray,
+                     hours: np.ndarray, minutes: np.ndarray, seconds: np.ndarray) -> np.ndarray:
+    """
+    Convert arrays of date/time components to Julian Dates
+    
+    Vectorized form of date_to_jd using the same integer formula.
+    
+    Args:
+        years, months, days: Calendar date components
+        hours, minutes, seconds: UT time components
+        
+    Returns:
+        Array of Julian Dates
+    """
+    years = np.asarray(years, dtype=np.int64)
+    months = np.asarray(months, dtype=np.int64)
+    days = np.asarray(days, dtype=np.int64)
+    
+    a = (14 - months) // 12
+    y = years + 4800 - a
+    m = months + 12 * a - 3
+    
+    jdn = days + (153 * m + 2) // 5 + 365 * y + y // 4 - y // 100 + y // 400 - 32045
+    return (jdn + (np.asarray(hours) - 12) / 24.0 + np.asarray(minutes) / 1440.0
+            + np.asarray(seconds) / 86400.0)
+
+
 def get_jd() -> float:
     """
     Get current Julian Date
     
+    get_tm() has one-second resolution, so the result is cached for the
+    current epoch second.
+    
     Returns:
         Current Julian Date
     """
+    global _jd_cache
+    key = (int(time.time()), UT_OFFSET)
+    if _jd_cache[0] == key:
+        return _jd_cache[1]
     dt, ut = get_tm()
-    return date_to_jd(dt)
+    jd = date_to_jd(dt)
+    _jd_cache = (key, jd)
+    return jd
 
 
 # Module initialization
@@ -977,7 +1378,7 @@ if __name__ == "__main__":
         print_telescope_status(status)
     
     # Example field
-    field = Field(field_number=1, n_done=0, filename="test.fits")
+    field = Field(field_number=1, n_done=1, filenames=["test.fits"])
     
     # Get telescope offsets
     get_telescope_offsets(field, status)
\ No newline at end of file
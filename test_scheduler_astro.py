@@ -6,19 +6,21 @@ Tests sun and moon rise/set times for La Silla Observatory
 
 import sys
 import os
-from datetime import datetime, timedelta
+import math
+import bisect
+from datetime import datetime
 
 # Add src directory to path to import scheduler_astro
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from scheduler_astropy import (
     julian_date,
-    jd_to_datetime,
     lst,
     moon_position,
     rise_set_times,
     twilight_times,
-    altitude_azimuth,
+    altitude_azimuth_fast,
+    ObserverTrig,
     airmass,
     moon_separation
 )
@@ -30,16 +32,27 @@ LA_SILLA_LONGITUDE = 70.7377 / 15.0  # convert to hours (west is positive)
 # LA_SILLA_ALTITUDE = 2400  # meters (not used in basic calculations)
 LA_SILLA_ALTITUDE = 2347  # meters (not used in basic calculations)
 
+# Latitude trig terms, computed once for all Alt/Az calls at La Silla
+LA_SILLA_TRIG = ObserverTrig.from_latitude(LA_SILLA_LATITUDE)
+
 # Time zone offset for Chile
 # Chile uses CLT (UTC-3) in winter and CLST (UTC-4) in summer
 # For simplicity, we'll use UTC-3 as standard, but this should be adjusted based on date
+# UTC offset by month (index 1-12): -4 CLST (summer, October-March), -3 CLT (winter)
+_CHILE_OFFSET = (None, -4, -4, -4, -3, -3, -3, -3, -3, -3, -4, -4, -4)
+
+
 def get_chile_offset(month):
     """Get Chile time zone offset based on month (simplified)"""
-    # Chile DST roughly from October to March (southern hemisphere)
-    if month >= 10 or month <= 3:
-        return -4  # CLST (summer time)
-    else:
-        return -3  # CLT (winter time)
+    return _CHILE_OFFSET[month]
+
+
+# Moon phase names by illumination: _PHASE_NAMES[i] applies below
+# _PHASE_THRESHOLDS[i] (and the last name at or above the last threshold)
+_PHASE_THRESHOLDS = (0.05, 0.23, 0.27, 0.48, 0.52, 0.73, 0.77, 0.95)
+_PHASE_NAMES = ("New Moon", "Waxing Crescent", "First Quarter", "Waxing Gibbous",
+                "Full Moon", "Waning Gibbous", "Last Quarter", "Waning Crescent",
+                "New Moon")
 
 
 def format_jd_to_time(jd, date_jd, timezone_offset=0):
@@ -47,18 +60,19 @@ def format_jd_to_time(jd, date_jd, timezone_offset=0):
     Convert JD to readable time format in both UT and local time
     Returns tuple of (ut_string, local_string)
     """
-    dt = jd_to_datetime(jd)
+    # Whole minutes since 0h UT; divmod gives the local time and how many
+    # calendar days it lies from the UT date (month boundaries included)
+    ut_min = int((jd + 0.5 - math.floor(jd + 0.5)) * 1440)
+    day_offset, local_min = divmod(ut_min + timezone_offset * 60, 1440)
     
     # UT time
-    ut_str = dt.strftime("%H:%M")
+    ut_str = f"{ut_min // 60:02d}:{ut_min % 60:02d}"
     
     # Local time
-    local_dt = dt + timedelta(hours=timezone_offset)
+    local_str = f"{local_min // 60:02d}:{local_min % 60:02d}"
     # Handle day boundary
-    if local_dt.day != dt.day:
-        local_str = local_dt.strftime("%H:%M (next day)") if local_dt.day > dt.day else local_dt.strftime("%H:%M (prev day)")
-    else:
-        local_str = local_dt.strftime("%H:%M")
+    if day_offset:
+        local_str += " (next day)" if day_offset > 0 else " (prev day)"
     
     return ut_str, local_str
 
@@ -69,7 +83,7 @@ def format_time_display(label, jd, date_jd, timezone_offset):
     return f"{label:22s} {ut_str} UT / {local_str} CLT"
 
 
-def calculate_sun_times(year, month, day):
+def calculate_sun_times(year, month, day, jd_noon, jd_start):
     """Calculate sun rise/set and twilight times"""
     print(f"\n{'='*70}")
     print(f"SUN CALCULATIONS FOR {year:04d}-{month:02d}-{day:02d}")
@@ -80,10 +94,6 @@ def calculate_sun_times(year, month, day):
     tz_name = "CLST" if tz_offset == -4 else "CLT"
     print(f"Time Zone: {tz_name} (UTC{tz_offset:+d})")
     
-    # Calculate JD for noon of the given date
-    jd_noon = julian_date(year, month, day, 12, 0, 0)
-    jd_start = julian_date(year, month, day, 0, 0, 0)
-    
     print(f"Julian Date (noon): {jd_noon:.4f}")
     
     # Get twilight times (includes sunrise/sunset)
@@ -132,7 +142,7 @@ def calculate_sun_times(year, month, day):
     return twilight, tz_offset, tz_name
 
 
-def calculate_moon_times(year, month, day, tz_offset, tz_name):
+def calculate_moon_times(year, month, day, jd_noon, jd_start, tz_offset, tz_name):
     """Calculate moon rise/set times and phase"""
     print(f"\n{'='*70}")
     print(f"MOON CALCULATIONS FOR {year:04d}-{month:02d}-{day:02d}")
@@ -141,8 +151,7 @@ def calculate_moon_times(year, month, day, tz_offset, tz_name):
     # Calculate JD for local midnight (00:00 local time)
     # Local midnight is at UTC + abs(tz_offset) hours
     # For example, if tz_offset is -4, local midnight 00:00 is at 04:00 UT
-    jd_midnight_local = julian_date(year, month, day, 0, 0, 0) + 1 - tz_offset / 24.0
-    jd_start = julian_date(year, month, day, 0, 0, 0)
+    jd_midnight_local = jd_start + 1 - tz_offset / 24.0
     
     # Get moon position at local midnight
     moon_ra, moon_dec, illumination = moon_position(jd_midnight_local)
@@ -161,24 +170,7 @@ def calculate_moon_times(year, month, day, tz_offset, tz_name):
     print(f"  Illumination: {illumination:.1%}")
     
     # Determine moon phase name
-    if illumination < 0.05:
-        phase_name = "New Moon"
-    elif illumination < 0.23:
-        phase_name = "Waxing Crescent"
-    elif illumination < 0.27:
-        phase_name = "First Quarter"
-    elif illumination < 0.48:
-        phase_name = "Waxing Gibbous"
-    elif illumination < 0.52:
-        phase_name = "Full Moon"
-    elif illumination < 0.73:
-        phase_name = "Waning Gibbous"
-    elif illumination < 0.77:
-        phase_name = "Last Quarter"
-    elif illumination < 0.95:
-        phase_name = "Waning Crescent"
-    else:
-        phase_name = "New Moon"
+    phase_name = _PHASE_NAMES[bisect.bisect_right(_PHASE_THRESHOLDS, illumination)]
     
     print(f"  Phase:        {phase_name}")
     
@@ -187,7 +179,7 @@ def calculate_moon_times(year, month, day, tz_offset, tz_name):
     print(f"  LST:          {lst_midnight:.2f} hours")
     
     # Calculate altitude and azimuth at local midnight
-    alt, az = altitude_azimuth(moon_ra, moon_dec, lst_midnight, LA_SILLA_LATITUDE)
+    alt, az = altitude_azimuth_fast(moon_ra, moon_dec, lst_midnight, LA_SILLA_TRIG)
     print(f"  Altitude:     {alt:.1f}°")
     print(f"  Azimuth:      {az:.1f}°")
     if alt > 0:
@@ -197,7 +189,6 @@ def calculate_moon_times(year, month, day, tz_offset, tz_name):
         print(f"  Status:       Below horizon")
     
     # Calculate moon rise/set times (use noon JD for consistency with rise/set calculations)
-    jd_noon = julian_date(year, month, day, 12, 0, 0)
     rise_jd, set_jd = rise_set_times(moon_ra, moon_dec, jd_noon, 
                                      LA_SILLA_LONGITUDE, LA_SILLA_LATITUDE)
     
@@ -229,7 +220,7 @@ def calculate_moon_times(year, month, day, tz_offset, tz_name):
     return moon_ra, moon_dec, illumination
 
 
-def calculate_observing_conditions(year, month, day, twilight, moon_info, tz_offset, tz_name):
+def calculate_observing_conditions(jd_start, twilight, moon_info, tz_offset, tz_name):
     """Analyze observing conditions for the night"""
     print(f"\n{'='*70}")
     print(f"OBSERVING CONDITIONS SUMMARY")
@@ -257,11 +248,11 @@ def calculate_observing_conditions(year, month, day, twilight, moon_info, tz_off
         # Get moon position at dusk and dawn
         moon_ra_dusk, moon_dec_dusk, _ = moon_position(dusk_time)
         lst_dusk = lst(dusk_time, LA_SILLA_LONGITUDE)
-        alt_dusk, _ = altitude_azimuth(moon_ra_dusk, moon_dec_dusk, lst_dusk, LA_SILLA_LATITUDE)
+        alt_dusk, _ = altitude_azimuth_fast(moon_ra_dusk, moon_dec_dusk, lst_dusk, LA_SILLA_TRIG)
         
         moon_ra_dawn, moon_dec_dawn, _ = moon_position(dawn_time)
         lst_dawn = lst(dawn_time, LA_SILLA_LONGITUDE)
-        alt_dawn, _ = altitude_azimuth(moon_ra_dawn, moon_dec_dawn, lst_dawn, LA_SILLA_LATITUDE)
+        alt_dawn, _ = altitude_azimuth_fast(moon_ra_dawn, moon_dec_dawn, lst_dawn, LA_SILLA_TRIG)
         
         if alt_dusk > 0 or alt_dawn > 0:
             print(f"Moon visibility during dark hours: Yes")
@@ -274,7 +265,6 @@ def calculate_observing_conditions(year, month, day, twilight, moon_info, tz_off
         dawn_time = twilight['astronomical_dawn']
         
         # Convert to both time formats
-        jd_start = julian_date(year, month, day, 0, 0, 0)
         ut_dusk, local_dusk = format_jd_to_time(dusk_time, jd_start, tz_offset)
         ut_dawn, local_dawn = format_jd_to_time(dawn_time, jd_start, tz_offset)
         
@@ -325,14 +315,18 @@ def main():
         today = datetime.now()
         year, month, day = today.year, today.month, today.day
     
+    # Julian Dates for the start and noon of the date, shared by all sections
+    jd_start = julian_date(year, month, day, 0, 0, 0)
+    jd_noon = julian_date(year, month, day, 12, 0, 0)
+    
     # Calculate sun times and get timezone info
-    twilight, tz_offset, tz_name = calculate_sun_times(year, month, day)
+    twilight, tz_offset, tz_name = calculate_sun_times(year, month, day, jd_noon, jd_start)
     
     # Calculate moon times
-    moon_info = calculate_moon_times(year, month, day, tz_offset, tz_name)
+    moon_info = calculate_moon_times(year, month, day, jd_noon, jd_start, tz_offset, tz_name)
     
     # Analyze observing conditions
-    calculate_observing_conditions(year, month, day, twilight, moon_info, tz_offset, tz_name)
+    calculate_observing_conditions(jd_start, twilight, moon_info, tz_offset, tz_name)
     
     print("\n" + "="*70)
     print("Calculations complete!")
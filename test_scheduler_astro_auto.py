@@ -6,7 +6,10 @@ Tests sun and moon rise/set times for La Silla Observatory with predefined dates
 
 import sys
 import os
-from datetime import datetime, timedelta
+import math
+import logging
+import numpy as np
+from datetime import datetime
 
 # Add src directory to path to import scheduler_astro
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -15,12 +18,20 @@ from scheduler_astro import (
     julian_date,
     jd_to_datetime,
     lst,
+    lst_batch,
     moon_position,
+    moon_position_batch,
     rise_set_times,
+    rise_set_times_moon,
     twilight_times,
-    altitude_azimuth,
+    twilight_times_batch,
+    altitude_azimuth_fast,
+    ObserverTrig,
+    altitude_azimuth_batch,
     airmass,
+    airmass_batch,
     moon_separation,
+    precompute_rise_set,
     gmst,
     galactic_coordinates,
     ecliptic_coordinates,
@@ -28,44 +39,67 @@ from scheduler_astro import (
 )
 
 
+logger = logging.getLogger('scheduler_astro.test')
+
+
 # La Silla Observatory coordinates
 LA_SILLA_LATITUDE = -29.2567  # degrees (south is negative)
 LA_SILLA_LONGITUDE = 70.7377 / 15.0  # convert to hours (west is positive)
 LA_SILLA_ALTITUDE = 2400  # meters
 
+# Latitude trig terms, computed once for all Alt/Az calls at La Silla
+LA_SILLA_TRIG = ObserverTrig.from_latitude(LA_SILLA_LATITUDE)
+
+# Sample objects for test_observing_planning, stored as parallel arrays
+TEST_OBJECTS_NAMES = [
+    "M42 (Orion Nebula)",
+    "M31 (Andromeda)",
+    "Omega Centauri",
+    "LMC Center",
+    "SMC Center",
+    "Galactic Center",
+]
+TEST_OBJECTS_RA = np.array([5.583, 0.712, 13.446, 5.392, 0.877, 17.761])  # hours
+TEST_OBJECTS_DEC = np.array([-5.383, 41.269, -47.479, -69.756, -72.829, -29.008])  # degrees
+
+# Table header for test_multiple_dates
+MULTIPLE_DATES_HEADER = "\n".join([
+    "-" * 70,
+    f"{'Date':<25s} {'Dark Hours':<12s} {'Moon Phase':<15s} {'Moon Alt@Mid'}",
+    "-" * 70,
+])
+
+
+# UTC offset by month (index 1-12): -4 CLST (summer, October-March), -3 CLT (winter)
+_CHILE_OFFSET = (None, -4, -4, -4, -3, -3, -3, -3, -3, -3, -4, -4, -4)
+
 
 def get_chile_offset(month):
     """Get Chile time zone offset based on month (simplified)"""
-    # Chile DST roughly from October to March (southern hemisphere)
-    if month >= 10 or month <= 3:
-        return -4  # CLST (summer time)
-    else:
-        return -3  # CLT (winter time)
+    return _CHILE_OFFSET[month]
 
 
 def format_time_with_local(jd, tz_offset):
     """Format time with both UT and local time"""
-    dt = jd_to_datetime(jd)
-    ut_str = dt.strftime('%H:%M')
+    # Whole minutes since 0h UT, truncated like jd_to_datetime()
+    ut_min = int((jd + 0.5 - int(jd + 0.5)) * 1440)
+    day_off, local_min = divmod(ut_min + tz_offset * 60, 1440)
     
-    local_dt = dt + timedelta(hours=tz_offset)
-    local_str = local_dt.strftime('%H:%M')
+    ut_str = f"{ut_min // 60:02d}:{ut_min % 60:02d}"
+    local_str = f"{local_min // 60:02d}:{local_min % 60:02d}"
     
     # Add day indicator if different
-    if local_dt.day != dt.day:
-        if local_dt.day > dt.day:
-            local_str += "+1"
-        else:
-            local_str += "-1"
+    if day_off:
+        local_str += "+1" if day_off > 0 else "-1"
     
     return ut_str, local_str
 
 
 def test_specific_date(year, month, day):
     """Test calculations for a specific date"""
-    print(f"\n{'='*70}")
-    print(f"Testing date: {year:04d}-{month:02d}-{day:02d}")
-    print(f"{'='*70}")
+    logger.info("\n" + "=" * 70)
+    logger.info("Testing date: %04d-%02d-%02d", year, month, day)
+    logger.info("=" * 70)
     
     # Get timezone info
     tz_offset = get_chile_offset(month)
@@ -73,41 +107,41 @@ def test_specific_date(year, month, day):
     
     # Calculate JD
     jd_noon = julian_date(year, month, day, 12, 0, 0)
-    print(f"Julian Date (noon): {jd_noon:.4f}")
-    print(f"Time Zone: {tz_name} (UTC{tz_offset:+d})")
+    logger.info("Julian Date (noon): %.4f", jd_noon)
+    logger.info("Time Zone: %s (UTC%+d)", tz_name, tz_offset)
     
     # Test reverse conversion
     dt = jd_to_datetime(jd_noon)
-    print(f"JD to datetime: {dt.strftime('%Y-%m-%d %H:%M:%S')} UT")
+    logger.info("JD to datetime: %s UT", dt.strftime('%Y-%m-%d %H:%M:%S'))
     
     # Test GMST and LST
     gmst_hours = gmst(jd_noon)
     lst_hours = lst(jd_noon, LA_SILLA_LONGITUDE)
-    print(f"GMST: {gmst_hours:.4f} hours")
-    print(f"LST at La Silla: {lst_hours:.4f} hours")
+    logger.info("GMST: %.4f hours", gmst_hours)
+    logger.info("LST at La Silla: %.4f hours", lst_hours)
     
     # Get twilight times
     twilight = twilight_times(jd_noon, LA_SILLA_LONGITUDE, LA_SILLA_LATITUDE)
     
-    print(f"\nSun Rise/Set (UT / {tz_name}):")
-    if 'sunrise' in twilight and 'sunset' in twilight:
-        sunrise_ut, sunrise_local = format_time_with_local(twilight['sunrise'], tz_offset)
-        sunset_ut, sunset_local = format_time_with_local(twilight['sunset'], tz_offset)
-        print(f"  Sunrise:  {sunrise_ut} UT / {sunrise_local} {tz_name}")
-        print(f"  Sunset:   {sunset_ut} UT / {sunset_local} {tz_name}")
-    
-    print(f"\nAstronomical Twilight (UT / {tz_name}):")
-    if 'astronomical_dawn' in twilight and 'astronomical_dusk' in twilight:
-        dawn_ut, dawn_local = format_time_with_local(twilight['astronomical_dawn'], tz_offset)
-        dusk_ut, dusk_local = format_time_with_local(twilight['astronomical_dusk'], tz_offset)
-        print(f"  Dawn:     {dawn_ut} UT / {dawn_local} {tz_name}")
-        print(f"  Dusk:     {dusk_ut} UT / {dusk_local} {tz_name}")
+    logger.info("\nSun Rise/Set (UT / %s):", tz_name)
+    if not (math.isnan(twilight.sunrise) or math.isnan(twilight.sunset)):
+        sunrise_ut, sunrise_local = format_time_with_local(twilight.sunrise, tz_offset)
+        sunset_ut, sunset_local = format_time_with_local(twilight.sunset, tz_offset)
+        logger.info("  Sunrise:  %s UT / %s %s", sunrise_ut, sunrise_local, tz_name)
+        logger.info("  Sunset:   %s UT / %s %s", sunset_ut, sunset_local, tz_name)
+    
+    logger.info("\nAstronomical Twilight (UT / %s):", tz_name)
+    if not (math.isnan(twilight.astronomical_dawn) or math.isnan(twilight.astronomical_dusk)):
+        dawn_ut, dawn_local = format_time_with_local(twilight.astronomical_dawn, tz_offset)
+        dusk_ut, dusk_local = format_time_with_local(twilight.astronomical_dusk, tz_offset)
+        logger.info("  Dawn:     %s UT / %s %s", dawn_ut, dawn_local, tz_name)
+        logger.info("  Dusk:     %s UT / %s %s", dusk_ut, dusk_local, tz_name)
         
         # Calculate dark hours
-        dark_hours = (twilight['astronomical_dawn'] - twilight['astronomical_dusk']) * 24.0
+        dark_hours = (twilight.astronomical_dawn - twilight.astronomical_dusk) * 24.0
         if dark_hours < 0:
             dark_hours += 24.0
-        print(f"  Dark hours: {dark_hours:.2f}")
+        logger.info("  Dark hours: %.2f", dark_hours)
     
     # Moon calculations at local midnight
     jd_midnight_local = julian_date(year, month, day, 0, 0, 0) + 1 - tz_offset / 24.0
@@ -117,71 +151,70 @@ def test_specific_date(year, month, day):
     lst_midnight = lst(jd_midnight_local, LA_SILLA_LONGITUDE)
     
     # Calculate altitude at local midnight
-    alt, az = altitude_azimuth(moon_ra, moon_dec, lst_midnight, LA_SILLA_LATITUDE)
-    
-    print(f"\nMoon at Local Midnight (00:00 {tz_name}):")
-    print(f"  RA:       {moon_ra:.2f} hours")
-    print(f"  Dec:      {moon_dec:.2f} degrees")
-    print(f"  Phase:    {illumination:.1%}")
-    print(f"  Altitude: {alt:.1f}°")
-    print(f"  Azimuth:  {az:.1f}°")
+    alt, az = altitude_azimuth_fast(moon_ra, moon_dec, lst_midnight, LA_SILLA_TRIG)
+    
+    logger.info("\nMoon at Local Midnight (00:00 %s):", tz_name)
+    logger.info("  RA:       %.2f hours", moon_ra)
+    logger.info("  Dec:      %.2f degrees", moon_dec)
+    logger.info("  Phase:    %.1f%%", illumination * 100)
+    logger.info("  Altitude: %.1f°", alt)
+    logger.info("  Azimuth:  %.1f°", az)
     if alt > 0:
         am = airmass(alt)
-        print(f"  Airmass:  {am:.3f}")
+        logger.info("  Airmass:  %.3f", am)
     else:
-        print(f"  Status:   Below horizon")
+        logger.info("  Status:   Below horizon")
     
     # Moon rise/set (use noon JD for consistency)
-    rise_jd, set_jd = rise_set_times(moon_ra, moon_dec, jd_noon,
-                                     LA_SILLA_LONGITUDE, LA_SILLA_LATITUDE)
+    rise_jd, set_jd = rise_set_times_moon(jd_noon, LA_SILLA_LONGITUDE, LA_SILLA_LATITUDE)
     if rise_jd and set_jd:
         moonrise_ut, moonrise_local = format_time_with_local(rise_jd, tz_offset)
         moonset_ut, moonset_local = format_time_with_local(set_jd, tz_offset)
-        print(f"  Moonrise: {moonrise_ut} UT / {moonrise_local} {tz_name}")
-        print(f"  Moonset:  {moonset_ut} UT / {moonset_local} {tz_name}")
+        logger.info("  Moonrise: %s UT / %s %s", moonrise_ut, moonrise_local, tz_name)
+        logger.info("  Moonset:  %s UT / %s %s", moonset_ut, moonset_local, tz_name)
 
 
 def test_coordinate_transformations():
     """Test coordinate transformation functions"""
-    print(f"\n{'='*70}")
-    print("Testing Coordinate Transformations")
-    print(f"{'='*70}")
+    logger.info("\n" + "=" * 70)
+    logger.info("Testing Coordinate Transformations")
+    logger.info("=" * 70)
     
     # Test object: Vega
     ra_vega = 18.6156  # hours
     dec_vega = 38.7836  # degrees
     
-    print(f"\nVega (α Lyrae):")
-    print(f"  RA:  {ra_vega:.4f} hours")
-    print(f"  Dec: {dec_vega:.4f} degrees")
+    logger.info("\nVega (α Lyrae):")
+    logger.info("  RA:  %.4f hours", ra_vega)
+    logger.info("  Dec: %.4f degrees", dec_vega)
     
     # Galactic coordinates
     l, b = galactic_coordinates(ra_vega, dec_vega, 2000.0)
-    print(f"  Galactic l: {l:.2f}°, b: {b:.2f}°")
+    logger.info("  Galactic l: %.2f°, b: %.2f°", l, b)
     
     # Ecliptic coordinates
     jd = julian_date(2025, 10, 3, 12, 0, 0)
     epoch, lon, lat = ecliptic_coordinates(ra_vega, dec_vega, jd)
-    print(f"  Ecliptic λ: {lon:.2f}°, β: {lat:.2f}° (epoch {epoch:.1f})")
+    logger.info("  Ecliptic λ: %.2f°, β: %.2f° (epoch %.1f)", lon, lat, epoch)
     
     # Test altitude/azimuth at specific LST
     lst_test = 20.0  # hours
-    alt, az = altitude_azimuth(ra_vega, dec_vega, lst_test, LA_SILLA_LATITUDE)
-    print(f"\nAt LST = {lst_test:.1f}h:")
-    print(f"  Altitude: {alt:.2f}°")
-    print(f"  Azimuth:  {az:.2f}°")
+    alt, az = altitude_azimuth_fast(ra_vega, dec_vega, lst_test, LA_SILLA_TRIG)
+    logger.info("\nAt LST = %.1fh:", lst_test)
+    logger.info("  Altitude: %.2f°", alt)
+    logger.info("  Azimuth:  %.2f°", az)
     if alt > 0:
         am = airmass(alt, 'young')
-        print(f"  Airmass:  {am:.3f}")
+        logger.info("  Airmass:  %.3f", am)
         refr = atmospheric_refraction(alt)
-        print(f"  Refraction: {refr:.3f}°")
+        logger.info("  Refraction: %.3f°", refr)
 
 
 def test_extreme_cases():
     """Test extreme cases and edge conditions"""
-    print(f"\n{'='*70}")
-    print("Testing Extreme Cases")
-    print(f"{'='*70}")
+    logger.info("\n" + "=" * 70)
+    logger.info("Testing Extreme Cases")
+    logger.info("=" * 70)
     
     # Test circumpolar object (never sets)
     ra_polar = 0.0  # hours
@@ -191,13 +224,13 @@ def test_extreme_cases():
     rise_jd, set_jd = rise_set_times(ra_polar, dec_polar, jd,
                                      LA_SILLA_LONGITUDE, LA_SILLA_LATITUDE)
     
-    print(f"\nCircumpolar object (RA={ra_polar}h, Dec={dec_polar}°):")
+    logger.info("\nCircumpolar object (RA=%sh, Dec=%s°):", ra_polar, dec_polar)
     if rise_jd == jd and set_jd == jd + 1.0:
-        print("  Status: Always above horizon (circumpolar)")
+        logger.info("  Status: Always above horizon (circumpolar)")
     elif rise_jd is None:
-        print("  Status: Never rises")
+        logger.info("  Status: Never rises")
     else:
-        print(f"  Rise: JD {rise_jd:.4f}, Set: JD {set_jd:.4f}")
+        logger.info("  Rise: JD %.4f, Set: JD %.4f", rise_jd, set_jd)
     
     # Test object that never rises
     ra_never = 0.0  # hours  
@@ -206,25 +239,28 @@ def test_extreme_cases():
     rise_jd, set_jd = rise_set_times(ra_never, dec_never, jd,
                                      LA_SILLA_LONGITUDE, LA_SILLA_LATITUDE)
     
-    print(f"\nNever-rising object (RA={ra_never}h, Dec={dec_never}°):")
+    logger.info("\nNever-rising object (RA=%sh, Dec=%s°):", ra_never, dec_never)
     if rise_jd is None and set_jd is None:
-        print("  Status: Never rises above horizon")
+        logger.info("  Status: Never rises above horizon")
     else:
-        print(f"  Rise: JD {rise_jd:.4f}, Set: JD {set_jd:.4f}")
+        logger.info("  Rise: JD %.4f, Set: JD %.4f", rise_jd, set_jd)
     
     # Test airmass at different altitudes
-    print("\nAirmass vs Altitude:")
-    for alt in [90, 60, 45, 30, 20, 10, 5, 1]:
-        am_secant = airmass(alt, 'secant')
-        am_young = airmass(alt, 'young')
-        print(f"  Alt {alt:2d}°: Secant={am_secant:6.3f}, Young={am_young:6.3f}")
+    logger.info("\nAirmass vs Altitude:")
+    altitudes = [90, 60, 45, 30, 20, 10, 5, 1]
+    rows = []
+    for alt, am_secant, am_young in zip(altitudes,
+                                        airmass_batch(altitudes, 'secant').tolist(),
+                                        airmass_batch(altitudes, 'young').tolist()):
+        rows.append(f"  Alt {alt:2d}°: Secant={am_secant:6.3f}, Young={am_young:6.3f}")
+    logger.info("%s", "\n".join(rows))
 
 
 def test_multiple_dates():
     """Test calculations for multiple dates throughout the year"""
-    print(f"\n{'='*70}")
-    print("Testing Multiple Dates Throughout 2025")
-    print(f"{'='*70}")
+    logger.info("\n" + "=" * 70)
+    logger.info("Testing Multiple Dates Throughout 2025")
+    logger.info("=" * 70)
     
     # Test solstices and equinoxes
     test_dates = [
@@ -234,30 +270,28 @@ def test_multiple_dates():
         (2025, 12, 21, "Summer Solstice (Southern)")
     ]
     
-    print("\nNight Duration and Moon Phase at Key Dates:")
-    print("-" * 70)
-    print(f"{'Date':<25s} {'Dark Hours':<12s} {'Moon Phase':<15s} {'Moon Alt@Mid'}")
-    print("-" * 70)
-    
-    for year, month, day, description in test_dates:
-        jd_noon = julian_date(year, month, day, 12, 0, 0)
-        twilight = twilight_times(jd_noon, LA_SILLA_LONGITUDE, LA_SILLA_LATITUDE)
-        
-        # Get timezone offset
-        tz_offset = get_chile_offset(month)
-        tz_name = "CLST" if tz_offset == -4 else "CLT"
-        
-        # Calculate moon at local midnight
-        jd_midnight_local = julian_date(year, month, day, 0, 0, 0) + 1 - tz_offset / 24.0
-        moon_ra, moon_dec, illumination = moon_position(jd_midnight_local)
-        lst_midnight = lst(jd_midnight_local, LA_SILLA_LONGITUDE)
-        alt, _ = altitude_azimuth(moon_ra, moon_dec, lst_midnight, LA_SILLA_LATITUDE)
-        
-        if 'astronomical_dawn' in twilight and 'astronomical_dusk' in twilight:
-            dark_hours = (twilight['astronomical_dawn'] - twilight['astronomical_dusk']) * 24.0
-            if dark_hours < 0:
-                dark_hours += 24.0
-            
+    logger.info("\nNight Duration and Moon Phase at Key Dates:")
+    logger.info("%s", MULTIPLE_DATES_HEADER)
+    
+    # Twilight for every date in one vectorized call
+    jd_noons = np.array([julian_date(year, month, day, 12, 0, 0)
+                         for year, month, day, _ in test_dates])
+    twilight = twilight_times_batch(jd_noons, LA_SILLA_LONGITUDE, LA_SILLA_LATITUDE)
+    dark_hours_all = (twilight.astronomical_dawn - twilight.astronomical_dusk) * 24.0
+    dark_hours_all = np.where(dark_hours_all < 0, dark_hours_all + 24.0, dark_hours_all)
+    
+    # Moon at local midnight of every date, also vectorized
+    jd_midnights = np.array([julian_date(year, month, day, 0, 0, 0) + 1 - get_chile_offset(month) / 24.0
+                             for year, month, day, _ in test_dates])
+    moon_ra, moon_dec, illumination_all = moon_position_batch(jd_midnights)
+    moon_alt_all, _ = altitude_azimuth_batch(moon_ra, moon_dec,
+                                             lst_batch(jd_midnights, LA_SILLA_LONGITUDE),
+                                             LA_SILLA_LATITUDE)
+    
+    rows = []
+    for (year, month, day, description), dark_hours, illumination, alt in zip(
+            test_dates, dark_hours_all.tolist(), illumination_all.tolist(), moon_alt_all.tolist()):
+        if not math.isnan(dark_hours):
             # Determine moon phase name
             if illumination < 0.25:
                 phase = "Dark"
@@ -268,14 +302,17 @@ def test_multiple_dates():
             
             alt_str = f"{alt:5.1f}°" if alt > 0 else "Below"
             
-            print(f"  {description:25s} {dark_hours:5.2f} hours   {illumination:4.0%} ({phase:7s})   {alt_str}")
+            rows.append(f"  {description:25s} {dark_hours:5.2f} hours   {illumination:4.0%} ({phase:7s})   {alt_str}")
+    
+    if rows:
+        logger.info("%s", "\n".join(rows))
 
 
 def test_observing_planning():
     """Test practical observing planning scenarios"""
-    print(f"\n{'='*70}")
-    print("Testing Observing Planning Scenarios")
-    print(f"{'='*70}")
+    logger.info("\n" + "=" * 70)
+    logger.info("Testing Observing Planning Scenarios")
+    logger.info("=" * 70)
     
     # Test for tonight (or a specific date)
     year, month, day = 2025, 10, 3
@@ -285,81 +322,98 @@ def test_observing_planning():
     tz_offset = get_chile_offset(month)
     tz_name = "CLST" if tz_offset == -4 else "CLT"
     
-    print(f"\nObserving Plan for {year:04d}-{month:02d}-{day:02d}:")
-    print("=" * 50)
+    logger.info("\nObserving Plan for %04d-%02d-%02d:", year, month, day)
+    logger.info("=" * 50)
     
     # Get twilight times
     twilight = twilight_times(jd_noon, LA_SILLA_LONGITUDE, LA_SILLA_LATITUDE)
     
-    if 'astronomical_dusk' in twilight and 'astronomical_dawn' in twilight:
+    if not (math.isnan(twilight.astronomical_dusk) or math.isnan(twilight.astronomical_dawn)):
         # Calculate observing hours
-        jd_dusk = twilight['astronomical_dusk']
-        jd_dawn = twilight['astronomical_dawn']
+        jd_dusk = twilight.astronomical_dusk
+        jd_dawn = twilight.astronomical_dawn
         
         # Display times
         dusk_ut, dusk_local = format_time_with_local(jd_dusk, tz_offset)
         dawn_ut, dawn_local = format_time_with_local(jd_dawn, tz_offset)
         
-        print(f"Observing Window:")
-        print(f"  Start: {dusk_local} {tz_name} ({dusk_ut} UT)")
-        print(f"  End:   {dawn_local} {tz_name} ({dawn_ut} UT)")
+        logger.info("Observing Window:")
+        logger.info("  Start: %s %s (%s UT)", dusk_local, tz_name, dusk_ut)
+        logger.info("  End:   %s %s (%s UT)", dawn_local, tz_name, dawn_ut)
         
-        # Calculate LST range
-        lst_start = lst(jd_dusk, LA_SILLA_LONGITUDE)
-        lst_end = lst(jd_dawn, LA_SILLA_LONGITUDE)
+        # LST at dusk, dawn and local midnight in one call
+        jd_midnight_local = julian_date(year, month, day, 0, 0, 0) + 1 - tz_offset / 24.0
+        lst_start, lst_end, lst_midnight = lst_batch([jd_dusk, jd_dawn, jd_midnight_local],
+                                                     LA_SILLA_LONGITUDE).tolist()
         
-        print(f"\nLST Range: {lst_start:.2f}h - {lst_end:.2f}h")
+        logger.info("\nLST Range: %.2fh - %.2fh", lst_start, lst_end)
         
         # Moon info at local midnight
-        jd_midnight_local = julian_date(year, month, day, 0, 0, 0) + 1 - tz_offset / 24.0
         moon_ra, moon_dec, illumination = moon_position(jd_midnight_local)
-        lst_midnight = lst(jd_midnight_local, LA_SILLA_LONGITUDE)
-        moon_alt, moon_az = altitude_azimuth(moon_ra, moon_dec, lst_midnight, LA_SILLA_LATITUDE)
+        moon_alt, moon_az = altitude_azimuth_fast(moon_ra, moon_dec, lst_midnight, LA_SILLA_TRIG)
         
-        print(f"\nMoon at Local Midnight:")
-        print(f"  Illumination: {illumination:.0%}")
+        logger.info("\nMoon at Local Midnight:")
+        logger.info("  Illumination: %.0f%%", illumination * 100)
         if moon_alt > 0:
-            print(f"  Position: Alt {moon_alt:.1f}°, Az {moon_az:.1f}°")
+            logger.info("  Position: Alt %.1f°, Az %.1f°", moon_alt, moon_az)
         else:
-            print(f"  Position: Below horizon")
+            logger.info("  Position: Below horizon")
         
-        # Test visibility of some sample objects
-        test_objects = [
-            ("M42 (Orion Nebula)", 5.583, -5.383),
-            ("M31 (Andromeda)", 0.712, 41.269),
-            ("Omega Centauri", 13.446, -47.479),
-            ("LMC Center", 5.392, -69.756),
-            ("SMC Center", 0.877, -72.829),
-            ("Galactic Center", 17.761, -29.008)
-        ]
+        # Test visibility of the sample objects in one vectorized call
+        alt_arr, az_arr = altitude_azimuth_batch(TEST_OBJECTS_RA, TEST_OBJECTS_DEC,
+                                                 lst_midnight, LA_SILLA_LATITUDE)
+        am_arr = airmass_batch(alt_arr, 'young')
         
-        print(f"\nObject Visibility at Local Midnight (00:00 {tz_name}):")
-        print("-" * 50)
+        logger.info("\nObject Visibility at Local Midnight (00:00 %s):", tz_name)
+        logger.info("-" * 50)
         
-        for name, ra, dec in test_objects:
-            alt, az = altitude_azimuth(ra, dec, lst_midnight, LA_SILLA_LATITUDE)
+        rows = []
+        for name, alt, az, am in zip(TEST_OBJECTS_NAMES, alt_arr.tolist(),
+                                     az_arr.tolist(), am_arr.tolist()):
             if alt > 0:
-                am = airmass(alt, 'young')
                 status = f"Alt: {alt:5.1f}°, Az: {az:5.1f}°, AM: {am:4.2f}"
             else:
                 status = "Below horizon"
-            print(f"  {name:20s} {status}")
+            rows.append(f"  {name:20s} {status}")
+        logger.info("%s", "\n".join(rows))
+        
+        # Rise/set of the sample objects, looked up from a table precomputed
+        # for the night rather than one rise_set_times() call per object
+        rise_table, set_table = precompute_rise_set(TEST_OBJECTS_RA, TEST_OBJECTS_DEC, [jd_noon],
+                                                    LA_SILLA_LONGITUDE, LA_SILLA_LATITUDE)
+        
+        logger.info("\nObject Rise/Set (UT / %s):", tz_name)
+        logger.info("-" * 50)
+        
+        rows = []
+        for name, rise_jd, set_jd in zip(TEST_OBJECTS_NAMES, rise_table[:, 0].tolist(),
+                                         set_table[:, 0].tolist()):
+            if math.isnan(rise_jd):
+                status = "Never rises"
+            elif rise_jd == jd_noon and set_jd == jd_noon + 1.0:
+                status = "Circumpolar"
+            else:
+                rise_ut, rise_local = format_time_with_local(rise_jd, tz_offset)
+                set_ut, set_local = format_time_with_local(set_jd, tz_offset)
+                status = f"Rise: {rise_ut} UT / {rise_local}, Set: {set_ut} UT / {set_local}"
+            rows.append(f"  {name:20s} {status}")
+        logger.info("%s", "\n".join(rows))
 
 
 def test_moon_tracking():
     """Test moon position throughout a night"""
-    print(f"\n{'='*70}")
-    print("Testing Moon Tracking Through the Night")
-    print(f"{'='*70}")
+    logger.info("\n" + "=" * 70)
+    logger.info("Testing Moon Tracking Through the Night")
+    logger.info("=" * 70)
     
     year, month, day = 2025, 10, 3
     tz_offset = get_chile_offset(month)
     tz_name = "CLST" if tz_offset == -4 else "CLT"
     
-    print(f"\nMoon Position Every 2 Hours on {year:04d}-{month:02d}-{day:02d}:")
-    print("-" * 60)
-    print(f"{'Local Time':<12s} {'UT Time':<10s} {'Altitude':<10s} {'Azimuth':<10s} {'Airmass'}")
-    print("-" * 60)
+    logger.info("\nMoon Position Every 2 Hours on %04d-%02d-%02d:", year, month, day)
+    logger.info("-" * 60)
+    logger.info("Local Time   UT Time    Altitude   Azimuth    Airmass")
+    logger.info("-" * 60)
     
     # Track moon from 20:00 to 06:00 local time
     for local_hour in [20, 22, 0, 2, 4, 6]:
@@ -374,7 +428,7 @@ def test_moon_tracking():
         # Get moon position
         moon_ra, moon_dec, _ = moon_position(jd_time)
         lst_time = lst(jd_time, LA_SILLA_LONGITUDE)
-        alt, az = altitude_azimuth(moon_ra, moon_dec, lst_time, LA_SILLA_LATITUDE)
+        alt, az = altitude_azimuth_fast(moon_ra, moon_dec, lst_time, LA_SILLA_TRIG)
         
         # Format times
         local_str = f"{local_hour:02d}:00 {tz_name}"
@@ -383,17 +437,63 @@ def test_moon_tracking():
         
         if alt > 0:
             am = airmass(alt)
-            print(f"  {local_str:<12s} {ut_str:<10s} {alt:6.1f}°    {az:6.1f}°    {am:5.2f}")
+            logger.info("  %-12s %-10s %6.1f°    %6.1f°    %5.2f", local_str, ut_str, alt, az, am)
         else:
-            print(f"  {local_str:<12s} {ut_str:<10s} Below horizon")
+            logger.info("  %-12s %-10s Below horizon", local_str, ut_str)
+
+
+def test_moon_rise_set_scan():
+    """Check rise_set_times_moon against a one-minute altitude scan"""
+    logger.info("\n" + "=" * 70)
+    logger.info("Checking Moonrise/Moonset Against an Altitude Scan")
+    logger.info("=" * 70)
+    
+    n_nights = 60
+    jd_start = julian_date(2025, 10, 1, 12, 0, 0)
+    step = 1.0 / 1440.0
+    offsets = np.arange(int(1.2 / step)) * step  # past jd + 1, for late events
+    
+    worst = 0.0
+    for night in range(n_nights):
+        jd_noon = jd_start + night
+        jd_grid = jd_noon + offsets
+        moon_ra, moon_dec, _ = moon_position_batch(jd_grid)
+        alt, _ = altitude_azimuth_batch(moon_ra, moon_dec,
+                                        lst_batch(jd_grid, LA_SILLA_LONGITUDE),
+                                        LA_SILLA_LATITUDE)
+        # The moon's altitude changes by < 0.3 deg/min; larger steps are
+        # GMST discontinuities at 0h UT, not crossings
+        smooth = np.abs(np.diff(alt)) < 0.4
+        rises = np.flatnonzero((alt[:-1] <= 0) & (alt[1:] > 0) & smooth)
+        sets = np.flatnonzero((alt[:-1] > 0) & (alt[1:] <= 0) & smooth)
+        
+        rise_jd, set_jd = rise_set_times_moon(jd_noon, LA_SILLA_LONGITUDE, LA_SILLA_LATITUDE)
+        for event_jd, crossings in ((rise_jd, rises), (set_jd, sets)):
+            error_min = abs(event_jd - jd_grid[crossings[0]]) * 1440.0
+            worst = max(worst, error_min)
+            assert error_min < 2.0, (
+                f"moon event at JD {event_jd:.5f} is {error_min:.1f} min from the scan "
+                f"crossing at JD {jd_grid[crossings[0]]:.5f}")
+    
+    logger.info("\n%d nights: worst moonrise/moonset error %.2f min", n_nights, worst)
 
 
 def main():
     """Main test function"""
-    print("\n" + "="*70)
-    print(" Automated Tests for scheduler_astro.py")
-    print(" La Silla Observatory: 29°15'S, 70°44'W")
-    print("="*70)
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Automated tests for scheduler_astro.py')
+    parser.add_argument('--quiet', action='store_true',
+                        help='Suppress the report (only warnings are shown), e.g. for timing runs')
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO,
+                        format='%(message)s', stream=sys.stdout)
+    
+    logger.info("\n" + "=" * 70)
+    logger.info(" Automated Tests for scheduler_astro.py")
+    logger.info(" La Silla Observatory: 29°15'S, 70°44'W")
+    logger.info("=" * 70)
     
     # Test today's date
     today = datetime.now()
@@ -417,9 +517,12 @@ def main():
     # Test moon tracking
     test_moon_tracking()
     
-    print("\n" + "="*70)
-    print(" All tests completed successfully!")
-    print("="*70 + "\n")
+    # Check moonrise/moonset against an altitude scan
+    test_moon_rise_set_scan()
+    
+    logger.info("\n" + "=" * 70)
+    logger.info(" All tests completed successfully!")
+    logger.info("=" * 70 + "\n")
 
 
 if __name__ == "__main__":
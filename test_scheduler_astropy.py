@@ -6,8 +6,22 @@ Verifies that the astropy-based implementation produces compatible results
 
 import sys
 import os
+import io
+import dataclasses
+import contextlib
+import traceback
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+import numpy as np
+from astropy.time import Time
+from astropy.utils import iers
+
+# Keep runs offline and repeatable: use the IERS tables bundled with
+# astropy rather than downloading IERS-A on the first UT1 conversion
+iers.conf.auto_download = False
+iers.conf.iers_degraded_accuracy = 'ignore'
+
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
@@ -19,23 +33,65 @@ import scheduler_astropy as astro_py
 LA_SILLA_LATITUDE = -29.2567  # degrees (south is negative)
 LA_SILLA_LONGITUDE = 70.7377 / 15.0  # convert to hours (west is positive)
 
+# Shared test epoch, built once and reused by every test
+_JD_TEST = astro_orig.julian_date(2025, 10, 3, 12, 0, 0)
+_JD_MONTH = _JD_TEST + np.arange(30.0)
 
-def compare_values(name, val1, val2, tolerance=0.01, unit=""):
-    """Compare two values and report differences"""
-    if val1 is None and val2 is None:
-        print(f"  {name:30s}: Both None - OK")
-        return True
-    elif val1 is None or val2 is None:
-        print(f"  {name:30s}: MISMATCH - Original: {val1}, Astropy: {val2}")
-        return False
-    
-    diff = abs(val1 - val2)
-    if diff <= tolerance:
-        print(f"  {name:30s}: {val1:.4f} vs {val2:.4f} {unit} (diff: {diff:.6f}) - OK")
-        return True
-    else:
-        print(f"  {name:30s}: {val1:.4f} vs {val2:.4f} {unit} (diff: {diff:.6f}) - MISMATCH")
-        return False
+# Precession test epochs
+_JD_J2000 = astro_orig.julian_date(2000, 1, 1, 12, 0, 0)
+_JD_J2025 = astro_orig.julian_date(2025, 1, 1, 12, 0, 0)
+_T_MONTH = Time(_JD_MONTH, format='jd')
+
+# Test targets, compared in one vectorized call per function
+TARGET_NAMES = ['Vega', 'Orion', 'Pleiades', 'Circumpolar']
+TARGET_RA = np.array([18.6156, 5.5, 3.79, 0.0])  # hours
+TARGET_DEC = np.array([38.7836, -5.0, 24.1, -89.0])  # degrees
+
+# The original module is scalar-only for these; vectorize it for comparison
+_orig_separation = np.vectorize(astro_orig.moon_separation)
+_orig_refraction = np.vectorize(astro_orig.atmospheric_refraction)
+
+
+# Set by --verbose: list every labelled entry, not just the mismatches
+VERBOSE = False
+
+
+def compare_arrays(name, arr1, arr2, tolerance=0.01, unit="", period=None, labels=None):
+    """
+    Compare two arrays and report the largest difference.
+    
+    NaN marks an event that does not occur and matches only another NaN.
+    Entries out of tolerance are listed by label (every entry with --verbose).
+    """
+    arr1 = np.asarray(arr1, dtype=float)
+    arr2 = np.asarray(arr2, dtype=float)
+    diff = arr1 - arr2
+    if period is not None:
+        # Wrap angles so 23.99h vs 0.01h counts as a small difference
+        diff = (diff + period / 2.0) % period - period / 2.0
+    abs_diff = np.abs(diff)
+    
+    with np.errstate(invalid='ignore'):
+        ok = (abs_diff <= tolerance) | (np.isnan(arr1) & np.isnan(arr2))
+    max_diff = np.nanmax(abs_diff) if not np.isnan(abs_diff).all() else 0.0
+    status = "OK" if ok.all() else "MISMATCH"
+    
+    # Build the whole report first and write it with a single print
+    lines = [f"  {name:30s}: max diff {max_diff:.6f} {unit} over {diff.size} samples - {status}"]
+    if labels is not None:
+        # Only the listed entries are formatted
+        listed = np.arange(ok.size) if VERBOSE else np.flatnonzero(~ok)
+        arr1, arr2 = np.broadcast_arrays(arr1, arr2)
+        for index in listed:
+            lines.append(f"    {labels[index]:28s}: {arr1.flat[index]:.4f} vs {arr2.flat[index]:.4f}"
+                         f" {unit} (diff: {abs_diff.flat[index]:.6f})"
+                         f" - {'OK' if ok.flat[index] else 'MISMATCH'}")
+    elif not ok.all():
+        lines.append("    diffs out of tolerance: " +
+                     np.array2string(diff[~ok], precision=6, threshold=10))
+    print("\n".join(lines))
+    
+    return bool(ok.all())
 
 
 def test_time_functions():
@@ -52,7 +108,7 @@ def test_time_functions():
     jd_py = astro_py.julian_date(year, month, day, hour, minute, second)
     
     print(f"\nJulian Date for {year}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}:{second:.1f}")
-    compare_values("Julian Date", jd_orig, jd_py, tolerance=0.00001)
+    compare_arrays("Julian Date", jd_orig, jd_py, tolerance=0.00001, labels=["JD"])
     
     # Test JD to datetime conversion
     dt_orig = astro_orig.jd_to_datetime(jd_orig)
@@ -62,15 +118,17 @@ def test_time_functions():
     print(f"  Original: {dt_orig}")
     print(f"  Astropy:  {dt_py}")
     
-    # Test GMST
-    gmst_orig = astro_orig.gmst(jd_orig)
-    gmst_py = astro_py.gmst(jd_py)
-    compare_values("GMST", gmst_orig, gmst_py, tolerance=0.001, unit="hours")
+    # GMST/LST sampled across a year, one call per module
+    jd_grid = jd_orig + np.linspace(0.0, 365.0, 1000)
+    print(f"\nSidereal time over {jd_grid.size} JDs:")
     
-    # Test LST
-    lst_orig = astro_orig.lst(jd_orig, LA_SILLA_LONGITUDE)
-    lst_py = astro_py.lst(jd_py, LA_SILLA_LONGITUDE)
-    compare_values("LST at La Silla", lst_orig, lst_py, tolerance=0.001, unit="hours")
+    gmst_orig = astro_orig.lst_batch(jd_grid, 0.0)
+    gmst_py = astro_py.gmst(jd_grid)
+    compare_arrays("GMST", gmst_orig, gmst_py, tolerance=0.001, unit="hours", period=24.0)
+    
+    lst_orig = astro_orig.lst_batch(jd_grid, LA_SILLA_LONGITUDE)
+    lst_py = astro_py.lst(jd_grid, LA_SILLA_LONGITUDE)
+    compare_arrays("LST at La Silla", lst_orig, lst_py, tolerance=0.001, unit="hours", period=24.0)
 
 
 def test_coordinate_transformations():
@@ -79,39 +137,39 @@ def test_coordinate_transformations():
     print("TESTING COORDINATE TRANSFORMATIONS")
     print("="*70)
     
-    # Test object: Vega
-    ra_vega = 18.6156  # hours
-    dec_vega = 38.7836  # degrees
-    
-    print(f"\nTest object: Vega (RA={ra_vega}h, Dec={dec_vega}°)")
+    print(f"\nTest objects: {', '.join(TARGET_NAMES)}")
     
     # Test Galactic coordinates
-    l_orig, b_orig = astro_orig.galactic_coordinates(ra_vega, dec_vega, 2000.0)
-    l_py, b_py = astro_py.galactic_coordinates(ra_vega, dec_vega, 2000.0)
+    l_orig, b_orig = astro_orig.galactic_coordinates_batch(TARGET_RA, TARGET_DEC, 2000.0)
+    l_py, b_py = astro_py.galactic_coordinates_batch(TARGET_RA, TARGET_DEC, 2000.0)
     
     print("\nGalactic Coordinates:")
-    compare_values("Galactic l", l_orig, l_py, tolerance=0.1, unit="deg")
-    compare_values("Galactic b", b_orig, b_py, tolerance=0.1, unit="deg")
+    compare_arrays("Galactic l", l_orig, l_py, tolerance=0.1, unit="deg", period=360.0,
+                   labels=TARGET_NAMES)
+    compare_arrays("Galactic b", b_orig, b_py, tolerance=0.1, unit="deg",
+                   labels=TARGET_NAMES)
     
     # Test Ecliptic coordinates
-    jd = astro_orig.julian_date(2025, 10, 3, 12, 0, 0)
-    epoch_orig, lon_orig, lat_orig = astro_orig.ecliptic_coordinates(ra_vega, dec_vega, jd)
-    epoch_py, lon_py, lat_py = astro_py.ecliptic_coordinates(ra_vega, dec_vega, jd)
+    _, lon_orig, lat_orig = astro_orig.ecliptic_coordinates_batch(TARGET_RA, TARGET_DEC, _JD_TEST)
+    _, lon_py, lat_py = astro_py.ecliptic_coordinates_batch(TARGET_RA, TARGET_DEC, _JD_TEST)
     
     print("\nEcliptic Coordinates:")
-    compare_values("Ecliptic longitude", lon_orig, lon_py, tolerance=0.5, unit="deg")
-    compare_values("Ecliptic latitude", lat_orig, lat_py, tolerance=0.5, unit="deg")
+    compare_arrays("Ecliptic longitude", lon_orig, lon_py, tolerance=0.5, unit="deg", period=360.0,
+                   labels=TARGET_NAMES)
+    compare_arrays("Ecliptic latitude", lat_orig, lat_py, tolerance=0.5, unit="deg",
+                   labels=TARGET_NAMES)
     
     # Test Precession
-    jd_from = astro_orig.julian_date(2000, 1, 1, 12, 0, 0)
-    jd_to = astro_orig.julian_date(2025, 1, 1, 12, 0, 0)
-    
-    ra_prec_orig, dec_prec_orig = astro_orig.precess_coordinates(ra_vega, dec_vega, jd_from, jd_to)
-    ra_prec_py, dec_prec_py = astro_py.precess_coordinates(ra_vega, dec_vega, jd_from, jd_to)
+    ra_prec_orig, dec_prec_orig = astro_orig.precess_coordinates_batch(TARGET_RA, TARGET_DEC,
+                                                                       _JD_J2000, _JD_J2025)
+    ra_prec_py, dec_prec_py = astro_py.precess_coordinates_batch(TARGET_RA, TARGET_DEC,
+                                                                 _JD_J2000, _JD_J2025)
     
     print("\nPrecession (J2000 to J2025):")
-    compare_values("Precessed RA", ra_prec_orig, ra_prec_py, tolerance=0.001, unit="hours")
-    compare_values("Precessed Dec", dec_prec_orig, dec_prec_py, tolerance=0.01, unit="deg")
+    compare_arrays("Precessed RA", ra_prec_orig, ra_prec_py, tolerance=0.001, unit="hours", period=24.0,
+                   labels=TARGET_NAMES)
+    compare_arrays("Precessed Dec", dec_prec_orig, dec_prec_py, tolerance=0.01, unit="deg",
+                   labels=TARGET_NAMES)
 
 
 def test_sun_moon_calculations():
@@ -120,30 +178,41 @@ def test_sun_moon_calculations():
     print("TESTING SUN AND MOON CALCULATIONS")
     print("="*70)
     
-    jd = astro_orig.julian_date(2025, 10, 3, 12, 0, 0)
+    # Sun and moon over a lunar month: one call per module
+    moon_ra_orig, moon_dec_orig, illum_orig = astro_orig.moon_position_batch(_JD_MONTH)
+    sun_ra, sun_dec, moon_ra_py, moon_dec_py, illum_py = astro_py.sun_moon_position(
+        _JD_MONTH, time=_T_MONTH)
     
     # Test sun position (only in astropy version)
     print("\nSun Position (astropy only):")
-    sun_ra, sun_dec = astro_py.sun_position(jd)
-    print(f"  Sun RA:  {sun_ra:.4f} hours")
-    print(f"  Sun Dec: {sun_dec:.4f} degrees")
-    
-    # Test moon position
-    moon_ra_orig, moon_dec_orig, illum_orig = astro_orig.moon_position(jd)
-    moon_ra_py, moon_dec_py, illum_py = astro_py.moon_position(jd)
+    print(f"  Sun RA:  {sun_ra[0]:.4f} hours")
+    print(f"  Sun Dec: {sun_dec[0]:.4f} degrees")
     
-    print("\nMoon Position:")
-    compare_values("Moon RA", moon_ra_orig, moon_ra_py, tolerance=0.5, unit="hours")
-    compare_values("Moon Dec", moon_dec_orig, moon_dec_py, tolerance=2.0, unit="deg")
-    compare_values("Moon Illumination", illum_orig, illum_py, tolerance=0.1)
+    print(f"\nMoon Position over {_JD_MONTH.size} nights:")
+    compare_arrays("Moon RA", moon_ra_orig, moon_ra_py, tolerance=0.5, unit="hours", period=24.0)
+    compare_arrays("Moon Dec", moon_dec_orig, moon_dec_py, tolerance=2.0, unit="deg")
+    compare_arrays("Moon Illumination", illum_orig, illum_py, tolerance=0.1)
     
     # Test separation
     ra1, dec1 = 5.5, 23.5  # Pleiades
-    sep_orig = astro_orig.moon_separation(ra1, dec1, moon_ra_orig, moon_dec_orig)
+    sep_orig = _orig_separation(ra1, dec1, moon_ra_orig, moon_dec_orig)
     sep_py = astro_py.moon_separation(ra1, dec1, moon_ra_py, moon_dec_py)
     
     print("\nMoon-Pleiades Separation:")
-    compare_values("Angular separation", sep_orig, sep_py, tolerance=2.0, unit="deg")
+    compare_arrays("Angular separation", sep_orig, sep_py, tolerance=2.0, unit="deg")
+    
+    # Interpolated sun/moon table against direct evaluation, between grid points
+    table = astro_py.build_sunmoon_interp(_JD_MONTH[0], _JD_MONTH[-1], n=100)
+    jd_mid = _JD_MONTH[:-1] + 0.5
+    direct = astro_py.sun_moon_position(jd_mid)
+    interp = astro_py.sun_moon_position(jd_mid, interp=table)
+    
+    print("\nInterpolated vs direct ephemeris (astropy only):")
+    compare_arrays("Sun position", astro_py.moon_separation(*direct[:2], *interp[:2]) * 3600.0,
+                   0.0, tolerance=1.0, unit="arcsec")
+    compare_arrays("Moon position", astro_py.moon_separation(*direct[2:4], *interp[2:4]) * 3600.0,
+                   0.0, tolerance=1.0, unit="arcsec")
+    compare_arrays("Moon Illumination", direct[4], interp[4], tolerance=1e-5)
 
 
 def test_rise_set_times():
@@ -152,37 +221,28 @@ def test_rise_set_times():
     print("TESTING RISE/SET TIME CALCULATIONS")
     print("="*70)
     
-    jd = astro_orig.julian_date(2025, 10, 3, 12, 0, 0)
-    
-    # Test for Orion (should rise and set)
-    ra_orion = 5.5  # hours
-    dec_orion = -5.0  # degrees
-    
-    print(f"\nOrion (RA={ra_orion}h, Dec={dec_orion}°) at La Silla:")
+    jd = _JD_TEST
     
-    rise_orig, set_orig = astro_orig.rise_set_times(ra_orion, dec_orion, jd, 
-                                                     LA_SILLA_LONGITUDE, LA_SILLA_LATITUDE)
-    rise_py, set_py = astro_py.rise_set_times(ra_orion, dec_orion, jd,
-                                              LA_SILLA_LONGITUDE, LA_SILLA_LATITUDE)
+    print(f"\nTest objects at La Silla: {', '.join(TARGET_NAMES)}")
     
-    compare_values("Rise time (JD)", rise_orig, rise_py, tolerance=0.01)
-    compare_values("Set time (JD)", set_orig, set_py, tolerance=0.01)
+    # NaN for objects that never rise, matching rise_set_times_batch()
+    rise_orig, set_orig = astro_orig.rise_set_times_batch(TARGET_RA, TARGET_DEC, jd,
+                                                          LA_SILLA_LONGITUDE, LA_SILLA_LATITUDE)
+    rise_set_py = [astro_py.rise_set_times(ra, dec, jd, LA_SILLA_LONGITUDE, LA_SILLA_LATITUDE)
+                   for ra, dec in zip(TARGET_RA, TARGET_DEC)]
+    rise_py = np.array([np.nan if rise is None else rise for rise, _ in rise_set_py])
+    set_py = np.array([np.nan if set_ is None else set_ for _, set_ in rise_set_py])
     
-    # Test circumpolar object
-    ra_circ = 0.0
-    dec_circ = -89.0
+    compare_arrays("Rise time (JD)", rise_orig, rise_py, tolerance=0.01, labels=TARGET_NAMES)
+    compare_arrays("Set time (JD)", set_orig, set_py, tolerance=0.01, labels=TARGET_NAMES)
     
-    print(f"\nCircumpolar object (RA={ra_circ}h, Dec={dec_circ}°) at La Silla:")
-    
-    rise_orig, set_orig = astro_orig.rise_set_times(ra_circ, dec_circ, jd,
-                                                     LA_SILLA_LONGITUDE, LA_SILLA_LATITUDE)
-    rise_py, set_py = astro_py.rise_set_times(ra_circ, dec_circ, jd,
-                                              LA_SILLA_LONGITUDE, LA_SILLA_LATITUDE)
-    
-    if rise_orig == jd and set_orig == jd + 1.0:
-        print("  Original: Circumpolar (always above horizon)")
-    if rise_py == jd and set_py == jd + 1.0:
-        print("  Astropy:  Circumpolar (always above horizon)")
+    # Circumpolar objects are reported as (jd, jd + 1)
+    circumpolar_orig = (rise_orig == jd) & (set_orig == jd + 1.0)
+    circumpolar_py = (rise_py == jd) & (set_py == jd + 1.0)
+    for name, orig, py in zip(TARGET_NAMES, circumpolar_orig, circumpolar_py):
+        if orig or py:
+            print(f"  {name}: circumpolar (always above horizon) - "
+                  f"Original: {'yes' if orig else 'no'}, Astropy: {'yes' if py else 'no'}")
 
 
 def test_twilight_times():
@@ -191,27 +251,16 @@ def test_twilight_times():
     print("TESTING TWILIGHT CALCULATIONS")
     print("="*70)
     
-    jd = astro_orig.julian_date(2025, 10, 3, 12, 0, 0)
-    
-    twilight_orig = astro_orig.twilight_times(jd, LA_SILLA_LONGITUDE, LA_SILLA_LATITUDE)
-    twilight_py = astro_py.twilight_times(jd, LA_SILLA_LONGITUDE, LA_SILLA_LATITUDE)
-    
-    print("\nTwilight Times at La Silla:")
+    # A month of nights in one call per module
+    twilight_orig = astro_orig.twilight_times_batch(_JD_MONTH, LA_SILLA_LONGITUDE, LA_SILLA_LATITUDE)
+    twilight_py = astro_py.twilight_times_batch(_JD_MONTH, LA_SILLA_LONGITUDE, LA_SILLA_LATITUDE)
     
-    twilight_types = [
-        ('sunrise', 'Sunrise'),
-        ('sunset', 'Sunset'),
-        ('civil_dawn', 'Civil Dawn'),
-        ('civil_dusk', 'Civil Dusk'),
-        ('nautical_dawn', 'Nautical Dawn'),
-        ('nautical_dusk', 'Nautical Dusk'),
-        ('astronomical_dawn', 'Astronomical Dawn'),
-        ('astronomical_dusk', 'Astronomical Dusk')
-    ]
+    print(f"\nTwilight Times at La Silla over {_JD_MONTH.size} nights:")
     
-    for key, name in twilight_types:
-        if key in twilight_orig and key in twilight_py:
-            compare_values(name, twilight_orig[key], twilight_py[key], tolerance=0.02)
+    for field in dataclasses.fields(twilight_py):
+        name = field.name.replace('_', ' ').title()
+        compare_arrays(name, getattr(twilight_orig, field.name), getattr(twilight_py, field.name),
+                       tolerance=0.02)
 
 
 def test_altitude_azimuth():
@@ -220,23 +269,29 @@ def test_altitude_azimuth():
     print("TESTING ALTITUDE/AZIMUTH CALCULATIONS")
     print("="*70)
     
-    ra = 5.5  # hours
-    dec = 23.5  # degrees
-    lst_hours = 6.0  # hours
+    lst_grid = np.linspace(0.0, 24.0, 97)
     
-    print(f"\nObject at RA={ra}h, Dec={dec}°, LST={lst_hours}h:")
+    print(f"\nTest objects over {lst_grid.size} LSTs:")
     
-    alt_orig, az_orig = astro_orig.altitude_azimuth(ra, dec, lst_hours, LA_SILLA_LATITUDE)
-    alt_py, az_py = astro_py.altitude_azimuth(ra, dec, lst_hours, LA_SILLA_LATITUDE)
+    # Every target at every LST in one call per module
+    ra = TARGET_RA[:, np.newaxis]
+    dec = TARGET_DEC[:, np.newaxis]
+    alt_orig, az_orig = astro_orig.altitude_azimuth_batch(ra, dec, lst_grid, LA_SILLA_LATITUDE)
+    alt_py, az_py = astro_py.altitude_azimuth_batch(ra, dec, lst_grid, LA_SILLA_LATITUDE)
     
-    compare_values("Altitude", alt_orig, alt_py, tolerance=0.01, unit="deg")
-    compare_values("Azimuth", az_orig, az_py, tolerance=0.01, unit="deg")
+    compare_arrays("Altitude", alt_orig, alt_py, tolerance=0.01, unit="deg")
+    compare_arrays("Azimuth", az_orig, az_py, tolerance=0.01, unit="deg", period=360.0)
     
-    # Test airmass
-    if alt_orig > 0:
-        am_orig = astro_orig.airmass(alt_orig, 'young')
-        am_py = astro_py.airmass(alt_py, 'young')
-        compare_values("Airmass (Young)", am_orig, am_py, tolerance=0.001)
+    # Test airmass on the computed altitudes and on a 5-90 degree grid
+    up = alt_orig > 0
+    am_orig = astro_orig.airmass_batch(alt_orig[up], 'young')
+    am_py = astro_py.airmass(alt_py[up], 'young')
+    compare_arrays("Airmass (Young)", am_orig, am_py, tolerance=0.001)
+    
+    alt_grid = np.arange(5.0, 91.0, 5.0)
+    for model in ('secant', 'hardie', 'young'):
+        compare_arrays(f"Airmass grid ({model})", astro_orig.airmass_batch(alt_grid, model),
+                       astro_py.airmass(alt_grid, model), tolerance=0.001)
 
 
 def test_refraction():
@@ -245,17 +300,61 @@ def test_refraction():
     print("TESTING ATMOSPHERIC REFRACTION")
     print("="*70)
     
-    test_altitudes = [1, 5, 10, 30, 45, 60, 90]
+    test_altitudes = np.array([1, 5, 10, 30, 45, 60, 90], dtype=float)
     
-    print("\nRefraction at various altitudes:")
-    for alt in test_altitudes:
-        refr_orig = astro_orig.atmospheric_refraction(alt)
-        refr_py = astro_py.atmospheric_refraction(alt)
-        compare_values(f"Refraction at {alt}°", refr_orig, refr_py, tolerance=0.0001, unit="deg")
+    print(f"\nRefraction at altitudes {test_altitudes.tolist()}:")
+    refr_orig = _orig_refraction(test_altitudes)
+    refr_py = astro_py.atmospheric_refraction(test_altitudes)
+    compare_arrays("Refraction", refr_orig, refr_py, tolerance=0.0001, unit="deg")
+
+
+# Independent comparison sections, reported in this order
+TESTS = (
+    test_time_functions,
+    test_coordinate_transformations,
+    test_sun_moon_calculations,
+    test_rise_set_times,
+    test_twilight_times,
+    test_altitude_azimuth,
+    test_refraction,
+)
+
+
+def _run_captured(test, verbose=False):
+    """
+    Run one test section and return (report, passed).
+    
+    A section that raises is reported with its traceback instead of
+    stopping the run, so the remaining sections still execute.
+    """
+    # Workers need the --verbose setting passed in explicitly under the
+    # spawn start method, where module globals are re-imported
+    global VERBOSE
+    VERBOSE = verbose
+    
+    buffer = io.StringIO()
+    passed = True
+    with contextlib.redirect_stdout(buffer):
+        try:
+            test()
+        except Exception:
+            passed = False
+            print(f"\nERROR: {test.__name__} raised an exception:")
+            traceback.print_exc(file=buffer)
+    return buffer.getvalue(), passed
 
 
 def main():
     """Main test function"""
+    global VERBOSE
+    
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Compare scheduler_astro.py with scheduler_astropy.py')
+    parser.add_argument('--verbose', action='store_true',
+                        help='List every compared entry, not just the mismatches')
+    VERBOSE = parser.parse_args().verbose
+    
     print("\n" + "="*70)
     print(" COMPARISON TEST: scheduler_astro.py vs scheduler_astropy.py")
     print(" Testing at La Silla Observatory: 29°15'S, 70°44'W")
@@ -268,23 +367,34 @@ def main():
     except ImportError:
         print("\nERROR: Astropy is not installed!")
         print("Please install it with: pip install astropy")
-        return
-    
-    # Run all tests
-    test_time_functions()
-    test_coordinate_transformations()
-    test_sun_moon_calculations()
-    test_rise_set_times()
-    test_twilight_times()
-    test_altitude_azimuth()
-    test_refraction()
+        return 1
+    
+    # Run all tests; the sections share no state, so spread them over the
+    # available cores and print the captured reports in order
+    workers = min(len(TESTS), os.cpu_count() or 1)
+    verbose = [VERBOSE] * len(TESTS)
+    failed = []
+    with contextlib.ExitStack() as stack:
+        if workers > 1:
+            run = stack.enter_context(ProcessPoolExecutor(max_workers=workers)).map
+        else:
+            run = map
+        for test, (report, passed) in zip(TESTS, run(_run_captured, TESTS, verbose)):
+            sys.stdout.write(report)
+            if not passed:
+                failed.append(test.__name__)
     
     print("\n" + "="*70)
-    print(" All comparison tests completed!")
+    if failed:
+        print(f" Comparison sections that crashed: {', '.join(failed)}")
+    else:
+        print(" All comparison tests completed!")
     print(" Note: Small differences are expected due to different algorithms")
     print(" Tolerances are set to acceptable levels for practical use")
     print("="*70 + "\n")
+    
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())